@@ -0,0 +1 @@
+# Benchmarks de latence de l'API (pytest benchmarks)
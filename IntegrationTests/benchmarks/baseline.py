@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Gestion des baselines de latence (benchmarks/baselines.json).
+
+Le fichier est versionné avec le code : toute mise à jour volontaire
+(--update-baselines) incrémente sa version et apparaît dans la revue.
+"""
+import json
+import os
+from datetime import datetime
+
+from utilities.fileLock import FileLock
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+
+def loadBaselines(path=BASELINE_FILE):
+    """
+    Lire le fichier de baselines.
+
+    Returns:
+        dict: {'version': int, 'updated': str, 'endpoints': {nom: stats}}
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'version': 0, 'updated': None, 'endpoints': {}}
+
+
+def saveBaseline(name, stats, path=BASELINE_FILE):
+    """
+    Enregistrer la mesure d'un endpoint comme nouvelle référence.
+    Protégé par un verrou : les workers parallèles écrivent le même fichier.
+    """
+    with FileLock(path + '.lock'):
+        baselines = loadBaselines(path)
+        today = datetime.now().strftime('%Y-%m-%d')
+        if baselines.get('updated') != today:
+            baselines['version'] = baselines.get('version', 0) + 1
+            baselines['updated'] = today
+        baselines.setdefault('endpoints', {})[name] = {
+            key: stats[key] for key in ('count', 'p50', 'p95', 'p99') if key in stats
+        }
+        baselines['endpoints'] = dict(sorted(baselines['endpoints'].items()))
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2)
+            f.write('\n')
+
+
+def findRegressions(stats, baseline, threshold, min_delta_ms):
+    """
+    Comparer une mesure à sa baseline.
+
+    Une métrique régresse si elle dépasse la baseline de plus de `threshold`
+    (ex: 0.25 = +25 %) ET d'au moins `min_delta_ms`, pour ignorer le bruit
+    sur les endpoints très rapides.
+
+    Returns:
+        list[str]: Les régressions détectées (vide si aucune).
+    """
+    regressions = []
+    for metric in ('p50', 'p95'):
+        reference = baseline.get(metric)
+        measured = stats.get(metric)
+        if reference is None or measured is None:
+            continue
+        limit = max(reference * (1 + threshold), reference + min_delta_ms)
+        if measured > limit:
+            regressions.append(
+                f'{metric}: {measured:.1f} ms > {limit:.1f} ms (baseline {reference:.1f} ms)')
+    return regressions
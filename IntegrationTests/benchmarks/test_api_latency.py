@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks de latence de l'API backend, séparés des tests fonctionnels.
+
+Usage (depuis le dossier IntegrationTests) :
+    pytest benchmarks                       # compare aux baselines
+    pytest benchmarks --update-baselines    # enregistre de nouvelles baselines
+
+En CI (variable CI définie) ou avec [benchmark] require_baselines = true,
+un endpoint sans baseline fait échouer le benchmark au lieu de l'ignorer.
+"""
+import time
+from datetime import date, timedelta
+
+import pytest
+import requests
+
+from benchmarks.baseline import findRegressions, loadBaselines, saveBaseline
+from utilities.latencyStats import summarize
+from utilities.readProperties import ReadConfig
+
+_start = date.today() + timedelta(days=30)
+_end = _start + timedelta(days=3)
+
+# (nom de baseline, méthode, chemin, rôle pour le token, corps JSON)
+ENDPOINTS = [
+    ('auth_login', 'POST', '/api/auth/login', None,
+     {'username': ReadConfig.getAdminUsername(), 'password': ReadConfig.getAdminPassword()}),
+    ('vehicles_list', 'GET', '/api/vehicles', None, None),
+    ('vehicles_by_id', 'GET', '/api/vehicles/1', None, None),
+    ('vehicles_available', 'GET', f'/api/vehicles/available?startDate={_start}&endDate={_end}', None, None),
+    ('vehicles_by_status', 'GET', '/api/vehicles/status/Available', None, None),
+    ('reports_dashboard', 'GET', '/api/reports/dashboard', 'admin', None),
+    ('reports_revenue_monthly', 'GET', '/api/reports/revenue/monthly', 'admin', None),
+    ('reports_vehicle_utilization', 'GET', '/api/reports/vehicles/utilization', 'admin', None),
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.api
+@pytest.mark.parametrize('name,method,path,role,body', ENDPOINTS, ids=[e[0] for e in ENDPOINTS])
+def test_endpoint_latency(request, api_client, token_provider, name, method, path, role, body):
+    """Mesurer la latence d'un endpoint et la comparer à sa baseline"""
+    token = None
+    if role:
+        token = token_provider.getToken(role)
+        if not token:
+            pytest.skip(f"Could not obtain {role} token")
+
+    def send():
+        return api_client.request(method, path, json=body, token=token)
+
+    # Premier envoi hors mesure : vérifie que l'API répond, même avec warmup = 0
+    try:
+        send()
+    except requests.exceptions.ConnectionError:
+        pytest.skip("API is not running")
+    for _ in range(ReadConfig.getBenchmarkWarmup() - 1):
+        send()
+
+    samples = []
+    for _ in range(ReadConfig.getBenchmarkIterations()):
+        start = time.perf_counter()
+        response = send()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code < 500, f"{method} {path} returned {response.status_code}"
+    stats = summarize(samples)
+    request.node.user_properties.append(('latency_ms', stats))
+
+    if request.config.getoption('--update-baselines'):
+        saveBaseline(name, stats)
+        return
+
+    baseline = loadBaselines()['endpoints'].get(name)
+    if baseline is None:
+        message = f"No baseline for '{name}'. Run 'pytest benchmarks --update-baselines' and commit baselines.json"
+        if ReadConfig.getBenchmarkRequireBaselines():
+            pytest.fail(message)
+        pytest.skip(message)
+
+    regressions = findRegressions(stats, baseline, ReadConfig.getBenchmarkThreshold(),
+                                  ReadConfig.getBenchmarkMinDelta())
+    assert not regressions, f"Latency regression on {name}: " + '; '.join(regressions)
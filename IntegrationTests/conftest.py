@@ -4,12 +4,14 @@ Configuration pytest pour les tests d'integration
 Pattern: Page Object Model avec Selenium
 Framework: pytest + Selenium
 Style: my_test mini project
+Execution parallele: pytest -n 4 (pytest-xdist), logs et captures isoles par worker
 """
 import pytest
 import os
 import sys
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import tempfile
+import uuid
+import warnings
 from datetime import datetime
 
 # Ajouter le repertoire parent au PYTHONPATH pour permettre les imports
@@ -17,39 +19,162 @@ CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 if CURRENT_DIR not in sys.path:
     sys.path.insert(0, CURRENT_DIR)
 
-# Importer ReadConfig après avoir ajouté le path
+# Importer les utilitaires après avoir ajouté le path
 from utilities.readProperties import ReadConfig
+from utilities import telemetry, testImpact, testScheduler
+from utilities.apiClient import ApiClient
+from utilities.browserSession import injectSession
+from utilities.customLogger import LogGen
+from utilities.dataFactory import DataFactory
+from utilities.dbSnapshot import DatabaseSnapshot
+from utilities.asyncApiClient import AsyncApiClient
+from utilities.driverFactory import createDriver, parseBrowser
+from utilities.driverPool import DriverPool
+from utilities.driverProfiler import DriverProfiler
+from utilities.gridSlots import GridSaturatedError
+from utilities.healthCheck import SmokeGate, describeFailures, runProbes
+from utilities.networkStub import MODES as NETWORK_STUB_MODES, NetworkStub, fixturePath
+from utilities.tokenProvider import TokenProvider
+from utilities.workerContext import (
+    cleanupChromeProfileDirs, isParallelWorker, mergeWorkerLogs
+)
 
 # Créer les répertoires nécessaires
 os.makedirs('./Screenshots', exist_ok=True)
 os.makedirs('./Logs', exist_ok=True)
 
 
+@pytest.fixture(scope='session')
+def driver_pools(request):
+    """
+    Pools de navigateurs partagés pour toute la session (un par worker en parallèle),
+    un pool par navigateur demandé (voir --browsers).
+    Les navigateurs restent ouverts entre les tests et sont fermés en fin de session.
+    Profil d'exécution (headless, allégé...) : section [selenium] de config.ini.
+    """
+    headless = False if request.config.getoption('--headed') else None
+    pools = {}
+
+    def getPool(browser):
+        if browser not in pools:
+            pools[browser] = DriverPool(lambda: createDriver(browser, headless=headless),
+                                        max_size=ReadConfig.getDriverPoolSize())
+        return pools[browser]
+
+    yield getPool
+    for pool in pools.values():
+        pool.close()
+    cleanupChromeProfileDirs()
+
+
 @pytest.fixture()
-def setup():
+def browser(request):
+    """
+    Navigateur du test : valeur de --browsers (tests paramétrés) ou `browser` de config.ini.
+    """
+    return getattr(request, 'param', None) or ReadConfig.getBrowser()
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Avec --browsers=chrome,firefox, chaque test UI est exécuté une fois par navigateur ;
+    avec pytest -n N, les variantes sont réparties sur les workers en parallèle.
+    """
+    browsers = metafunc.config.getoption('--browsers')
+    if browsers and 'browser' in metafunc.fixturenames:
+        names = [name.strip() for name in browsers.split(',') if name.strip()]
+        for name in names:
+            parseBrowser(name)
+        metafunc.parametrize('browser', names, indirect=True)
+
+
+@pytest.fixture()
+def setup(driver_pools, browser, request):
     """
     Fixture Pytest pour configurer le navigateur WebDriver.
-    Cette fixture initialise une instance de WebDriver pour le navigateur Chrome.
+    Cette fixture loue une instance de WebDriver déjà démarrée dans le pool du
+    navigateur du test et la rend au pool (cookies et stockage vidés) à la fin du test.
     
     Returns:
-        webdriver.Chrome: Une instance du WebDriver pour Chrome.
+        WebDriver: Une instance du WebDriver (Chrome par défaut).
     
     Avantage: permet de réutiliser le code de configuration dans plusieurs tests,
     de séparer le code de configuration du code de test, et de gérer automatiquement
     le cycle de vie des objets nécessaires pour les tests.
     """
-    # Configuration Chrome
-    chrome_options = Options()
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--disable-gpu')
+    driver_pool = driver_pools(browser)
+    try:
+        driver = driver_pool.acquire()
+    except GridSaturatedError as e:
+        # Grille saturée : le test est ignoré au lieu d'échouer ou de bloquer la session
+        pytest.skip(str(e))
+    request.node.commands_at_start = telemetry.commandCount(driver)
+    
+    # Profilage optionnel des commandes WebDriver (--profile-webdriver)
+    profiler = None
+    if request.config.getoption('--profile-webdriver') or ReadConfig.getProfileCommands():
+        profiler = DriverProfiler.attach(driver)
+        profiler.start()
     
-    # Initialiser le driver
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(ReadConfig.getImplicitWait())
+    # Réponses du backend enregistrées/rejouées pour les tests marqués stub_backend
+    stub = None
+    stub_mode = request.config.getoption('--network-stub') or ReadConfig.getNetworkStubMode()
+    if stub_mode != 'off' and request.node.get_closest_marker('stub_backend') \
+            and NetworkStub.isSupported(driver):
+        stub_file = fixturePath(ReadConfig.getNetworkFixturesDir(), request.node.nodeid)
+        try:
+            stub = NetworkStub(driver, ReadConfig.getApiURL(), stub_file, stub_mode).start()
+        except Exception:
+            # Replay sans enregistrement : rendre le driver avant d'échouer
+            if profiler is not None:
+                profiler.stop()
+            driver_pool.release(driver)
+            raise
     
-    return driver
+    yield driver
+    
+    stub_misses = []
+    if stub is not None:
+        try:
+            # N'enregistrer que les réponses d'un passage réussi
+            rep_call = getattr(request.node, 'rep_call', None)
+            if rep_call is not None and rep_call.passed:
+                stub.save()
+            stub_misses = stub.misses()
+        finally:
+            stub.stop()
+    if profiler is not None:
+        profiler.stop()
+    driver_pool.release(driver)
+    if stub_misses:
+        pytest.fail(f'Rejeu réseau : {len(stub_misses)} requête(s) absente(s) de {stub.path} '
+                    f'(réenregistrer avec --network-stub=record) : ' + ', '.join(sorted(set(stub_misses))))
+
+
+def pytest_addoption(parser):
+    """Options de ligne de commande propres aux tests d'integration"""
+    parser.addoption('--update-baselines', action='store_true', default=False,
+                     help='Enregistrer les mesures des benchmarks comme nouvelles baselines')
+    parser.addoption('--profile-webdriver', action='store_true', default=False,
+                     help='Profiler chaque commande WebDriver et joindre le profil au rapport')
+    parser.addoption('--browsers', default=None,
+                     help='Navigateurs séparés par des virgules (ex: chrome,firefox-headless) : '
+                          'chaque test UI est exécuté sur chacun')
+    parser.addoption('--network-stub', default=None, choices=NETWORK_STUB_MODES,
+                     help='Enregistrer/rejouer les réponses du backend des tests stub_backend '
+                          '(remplace network_stub de config.ini)')
+    parser.addoption('--impacted-by', default=None, metavar='REF',
+                     help='N\'exécuter que les tests impactés par git diff REF (ex: origin/main)')
+    parser.addoption('--shard-count', type=int, default=1,
+                     help='Nombre de shards de CI (répartition LPT selon les durées historiques)')
+    parser.addoption('--shard-id', type=int, default=0,
+                     help='Shard à exécuter, de 0 à --shard-count - 1')
+    parser.addoption('--shard-kind', default='all', choices=testScheduler.KINDS,
+                     help='ui : tests avec navigateur, api : tests sans navigateur (agents légers)')
+    parser.addoption('--no-health-check', action='store_true', default=False,
+                     help='Ne pas vérifier backend, login, base et frontend au démarrage')
+    parser.addoption('--headed', action='store_true', default=False,
+                     help='Ouvrir les navigateurs avec une fenêtre (débogage), même si headless = true')
 
 
 @pytest.fixture(scope='session')
@@ -64,52 +189,271 @@ def api_url():
     return ReadConfig.getApiURL()
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    Vérifier l'environnement une seule fois au démarrage (processus maître en parallèle).
+    Backend, login ou base indisponible : la session s'arrête avec un message unique.
+    Frontend indisponible : seuls les tests UI sont ignorés.
+    """
+    config = session.config
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None:
+        config.frontend_unavailable = workerinput.get('frontend_unavailable')
+        config.smoke_gate = SmokeGate(workerinput.get('smoke_gate_file'))
+        return
+    
+    config.frontend_unavailable = None
+    config.smoke_gate = SmokeGate(os.path.join(tempfile.gettempdir(), f'carrental-smoke-{uuid.uuid4().hex}.failed'))
+    if config.option.collectonly or config.getoption('--no-health-check') or not ReadConfig.getHealthCheck():
+        return
+    results = runProbes(ReadConfig.getApiURL(), ReadConfig.getBaseURL())
+    backend_failure = describeFailures(results, 'backend')
+    if backend_failure:
+        pytest.exit(backend_failure, returncode=pytest.ExitCode.INTERRUPTED)
+    config.frontend_unavailable = describeFailures(results, 'frontend')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """pytest-xdist : transmettre aux workers le résultat des sondes et la porte smoke"""
+    node.workerinput['frontend_unavailable'] = node.config.frontend_unavailable
+    node.workerinput['smoke_gate_file'] = node.config.smoke_gate.path
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Rattacher les événements de télémétrie et les endpoints appelés au test qui démarre"""
+    telemetry.setCurrentTest(item.nodeid)
+    testImpact.startTest(item.nodeid)
+    
+    # Un test smoke a échoué : les autres tests ne valent pas la peine d'être lancés
+    smoke_failure = item.config.smoke_gate.check()
+    if smoke_failure and not item.get_closest_marker('smoke'):
+        pytest.skip(f'Test smoke en échec ({smoke_failure})')
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Avec --impacted-by=REF, ne garder que les tests impactés par `git diff REF`
+    d'après la carte tests -> markers/endpoints/pages des exécutions précédentes,
+    puis appliquer le shard demandé et l'ordre "plus lents d'abord".
+    """
+    ref = config.getoption('--impacted-by')
+    if ref:
+        repo_root = testImpact.repoRoot(CURRENT_DIR)
+        changed = testImpact.changedFiles(ref, repo_root)
+        selected = testImpact.selectImpacted([item.nodeid for item in items],
+                                             testImpact.loadMap(), changed, repo_root)
+        _keepOnly(config, items, selected)
+    
+    # Répartition par type (agents avec ou sans navigateur) et par shard de CI
+    durations = testScheduler.loadDurations()
+    shard_kind = config.getoption('--shard-kind')
+    if shard_kind != 'all':
+        _keepOnly(config, items, {item.nodeid for item in items if _testKind(item) == shard_kind})
+    shard_count = config.getoption('--shard-count')
+    shard_id = config.getoption('--shard-id')
+    if not 0 <= shard_id < shard_count:
+        raise pytest.UsageError(f'--shard-id doit être compris entre 0 et {shard_count - 1}')
+    if shard_count > 1:
+        tests = [(item.nodeid, _testKind(item)) for item in items]
+        _keepOnly(config, items, set(testScheduler.assignShards(tests, durations, shard_count)[shard_id]))
+    
+    # Les tests historiquement les plus lents d'abord, sans mélanger modules et classes
+    if ReadConfig.getSlowestFirst():
+        order = testScheduler.slowestFirst([(item.nodeid, _testKind(item)) for item in items], durations)
+        position = {test_id: index for index, test_id in enumerate(order)}
+        items.sort(key=lambda item: position[item.nodeid])
+    
+    # Les tests smoke d'abord : ils conditionnent l'exécution du reste
+    # (au mieux sous xdist, voir SmokeGate)
+    items.sort(key=lambda item: item.get_closest_marker('smoke') is None)
+    
+    # Frontend injoignable (sondes de démarrage) : tests UI ignorés avec une raison unique
+    if config.frontend_unavailable:
+        skip_ui = pytest.mark.skip(reason=config.frontend_unavailable)
+        for item in items:
+            if _testKind(item) == 'ui':
+                item.add_marker(skip_ui)
+
+
+def _testKind(item):
+    """'ui' pour les tests qui pilotent un navigateur, 'api' sinon."""
+    return 'ui' if 'setup' in item.fixturenames or item.get_closest_marker('ui') else 'api'
+
+
+def _keepOnly(config, items, selected):
+    """Désélectionner (au sens de pytest) les tests absents de `selected`."""
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook pour capturer le statut du test"""
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f'rep_{rep.when}', rep)
+    
+    # Profil des commandes WebDriver joint au rapport (section + user_properties)
+    driver = item.funcargs.get('setup') if hasattr(item, 'funcargs') else None
+    profiler = getattr(driver, 'profiler', None)
+    if rep.when == 'call' and profiler is not None and profiler.recording:
+        rep.sections.append(('WebDriver profile', profiler.formatReport()))
+        item.user_properties.append(('webdriver_profile', profiler.summary()))
+    
+    # Événement JSONL de fin de test (durée, commandes WebDriver, résultat)
+    if rep.when == 'call' and telemetry.isEnabled():
+        commands = None
+        if driver is not None:
+            commands = telemetry.commandCount(driver) - getattr(item, 'commands_at_start', 0)
+        telemetry.emit('test', item.name, call.start, call.stop, rep.outcome, commands=commands)
+    
+    # Carte des tests impactés et historique des durées : seuls les tests
+    # réellement exécutés les mettent à jour
+    item.total_duration = getattr(item, 'total_duration', 0.0) + rep.duration
+    if rep.when == 'call':
+        item.executed = not rep.skipped
+    elif rep.when == 'teardown':
+        executed = getattr(item, 'executed', False)
+        testImpact.finishTest([marker.name for marker in item.iter_markers()],
+                              item.nodeid.split('::')[0], executed)
+        if executed:
+            testScheduler.recordDuration(item.nodeid, item.total_duration)
+    
+    if rep.failed and item.get_closest_marker('smoke'):
+        item.config.smoke_gate.fail(f'{item.name}: {rep.when} en échec')
+    
+    # Écrire tout de suite les logs en attente pour diagnostiquer l'échec
+    if rep.failed:
+        LogGen.flush()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    En exécution parallèle (pytest -n N), fusionner les logs des workers
+    dans ./Logs/automation.log une fois que tous les workers ont terminé.
+    Le rapport (pytest-html / junitxml) est déjà agrégé par le processus maître.
+    """
+    # Vider la file de logs asynchrone avant toute fusion
+    LogGen.shutdown()
+    # Chaque processus (workers compris) fusionne ses tests dans la carte d'impact
+    testImpact.saveMap()
+    testScheduler.saveDurations()
+    if isParallelWorker() or hasattr(session.config, 'workerinput'):
+        return
+    session.config.smoke_gate.cleanup()
+    mergeWorkerLogs('./Logs/automation.log')
 
 
 # Fixtures pour les tests API (si nécessaire)
+@pytest.fixture(scope='session')
+def token_provider(api_url, api_client):
+    """
+    Fournisseur de tokens partagé pour la session.
+    Les tokens sont mis en cache par rôle et renouvelés peu avant leur expiration.
+    """
+    return TokenProvider(api_url, client=api_client)
+
+
+@pytest.fixture()
+def login_as(setup, base_url, token_provider):
+    """
+    Fixture pour démarrer un test UI déjà authentifié.
+    Le login passe par POST /api/auth/login (token en cache) puis la session est
+    injectée dans le localStorage du navigateur : le formulaire /login n'est
+    utilisé que par les tests dédiés (TC023, TC024).
+
+    Usage:
+        driver = login_as('admin', '/vehicles/manage')
+    """
+    def login(role='admin', path='/'):
+        session = token_provider.getSession(role)
+        if session is None:
+            pytest.skip(f'Connexion API impossible pour le rôle {role}')
+        return injectSession(setup, base_url, session, path)
+    return login
+
+
 @pytest.fixture(scope='function')
-def auth_token(api_url):
+def auth_token(token_provider):
     """
-    Fixture pour obtenir un token d'authentification valide.
+    Fixture pour obtenir un token d'authentification valide (admin).
     Utilise pour les tests API necessitant une authentification.
+    Le token vient du cache du token_provider : le login n'est refait
+    que lorsque le token approche de son expiration.
     """
-    import requests
-    
-    login_data = {
-        'username': ReadConfig.getAdminUsername(),
-        'password': ReadConfig.getAdminPassword()
-    }
-    
-    try:
-        response = requests.post(f'{api_url}/api/auth/login', json=login_data)
-        if response.status_code == 200:
-            return response.json().get('token')
-    except Exception as e:
-        print(f'Erreur lors de l\'obtention du token: {e}')
-    
-    return None
+    return token_provider.getToken('admin')
 
 
-@pytest.fixture(scope='function')
-def api_client(api_url, auth_token):
+@pytest.fixture(scope='session')
+def api_client(api_url):
     """
-    Fixture pour un client API avec authentification.
-    Retourne une session requests avec headers configures.
+    Fixture pour le client API partagé par toute la session.
+    Les connexions HTTP sont réutilisées (keep-alive) entre les tests ;
+    passer token=auth_token pour une requête authentifiée.
     """
-    import requests
-    
-    session = requests.Session()
-    if auth_token:
-        session.headers.update({
-            'Authorization': f'Bearer {auth_token}',
-            'Content-Type': 'application/json'
-        })
-    
-    session.base_url = api_url
-    return session
+    client = ApiClient(api_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session')
+def async_api_client(api_url):
+    """
+    Fixture pour le client API asynchrone (requêtes concurrentes en masse).
+    Voir utilities/asyncApiClient.py pour gather() et assertAllStatus().
+    """
+    client = AsyncApiClient(api_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope='session')
+def db_snapshot():
+    """
+    Fixture pour l'instantané de la base du Backend, pris une fois par session.
+    None si [database] db_file n'est pas configuré ou en exécution parallèle
+    (la base est partagée : une restauration effacerait le travail des autres workers).
+    """
+    db_file = ReadConfig.getDatabaseFile()
+    if db_file is None or isParallelWorker():
+        yield None
+        return
+    snapshot = DatabaseSnapshot(db_file)
+    snapshot.take()
+    yield snapshot
+    snapshot.cleanup()
+
+
+@pytest.fixture(scope='module', autouse=True)
+def restore_database(db_snapshot):
+    """
+    Fixture pour remettre la base dans l'état de l'instantané après chaque module
+    de tests (API de sauvegarde SQLite au lieu des migrations et seeders).
+    """
+    yield
+    if db_snapshot is not None and db_snapshot.restore():
+        LogGen('./Logs/automation.log').log_info(f'Base de données restaurée: {db_snapshot.db_file}')
+
+
+@pytest.fixture()
+def data_factory(async_api_client, token_provider):
+    """
+    Fixture pour créer des données de test en masse via l'API (requêtes concurrentes).
+    Les entités sont uniques par exécution et supprimées en fin de test.
+
+    Usage:
+        vehicles = data_factory.createVehicles(1000)
+    """
+    factory = DataFactory(async_api_client, token_provider)
+    yield factory
+    failures = factory.teardown()
+    if failures:
+        message = f'Nettoyage incomplet des données de test ({len(failures)}): ' + '; '.join(failures[:10])
+        LogGen('./Logs/automation.log').log_warning(message)
+        # Visible dans le résumé pytest (warnings summary)
+        warnings.warn(message)
@@ -0,0 +1 @@
+# Tests de charge de l'API backend (python -m loadtest)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Point d'entrée des tests de charge.
+
+Usage (depuis le dossier IntegrationTests) :
+    python -m loadtest --journey rental --users 20 --ramp-up 10 --duration 60
+"""
+import argparse
+import sys
+
+from loadtest.journeys import JOURNEYS
+from loadtest.report import writeReports
+from loadtest.runner import LoadRunner
+from utilities.readProperties import ReadConfig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m loadtest',
+                                     description='Test de charge de l\'API backend')
+    parser.add_argument('--journey', choices=sorted(JOURNEYS), default='rental',
+                        help='Parcours utilisateur a rejouer')
+    parser.add_argument('--users', type=int, default=ReadConfig.getLoadUsers(),
+                        help='Nombre d\'utilisateurs virtuels simultanes')
+    parser.add_argument('--ramp-up', type=float, default=ReadConfig.getLoadRampUp(),
+                        help='Duree de montee en charge (secondes)')
+    parser.add_argument('--duration', type=float, default=ReadConfig.getLoadDuration(),
+                        help='Duree maximale du test (secondes)')
+    parser.add_argument('--iterations', type=int, default=None,
+                        help='Nombre de parcours par utilisateur (illimite par defaut)')
+    parser.add_argument('--api-url', default=ReadConfig.getApiURL())
+    parser.add_argument('--output-dir', default=ReadConfig.getLoadOutputDir())
+    args = parser.parse_args(argv)
+
+    runner = LoadRunner(args.api_url, JOURNEYS[args.journey](), users=args.users,
+                        ramp_up=args.ramp_up, duration=args.duration, iterations=args.iterations)
+    results = runner.run()
+    json_path, html_path = writeReports(results, args.output_dir)
+
+    print(f"{results['total_requests']} requetes en {results['duration_s']} s "
+          f"({results['throughput_rps']} req/s)")
+    for endpoint, stats in results['endpoints'].items():
+        print(f"  {endpoint:<40} p50={stats.get('p50')} p95={stats.get('p95')} "
+              f"p99={stats.get('p99')} ms, erreurs={stats['errors']}")
+    print(f'Rapports : {json_path}, {html_path}')
+    return 0 if results['journeys']['completed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
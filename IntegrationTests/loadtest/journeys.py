@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Parcours utilisateurs scriptés pour les tests de charge.
+Chaque étape est chronométrée et enregistrée sous un nom d'endpoint stable
+(ex: 'GET /api/vehicles/{id}') pour agréger les latences par endpoint.
+"""
+import random
+from datetime import datetime, timedelta
+
+from utilities.readProperties import ReadConfig
+
+
+class JourneyAborted(Exception):
+    """Une étape a échoué : la suite du parcours n'a plus de sens."""
+
+
+class RentalJourney:
+    """
+    Parcours client complet :
+    login -> liste des véhicules -> calcul du prix -> création -> annulation.
+
+    Les exercices de RentalsController (calculate-price, création, annulation)
+    sont ceux que l'on veut surveiller avant chaque livraison.
+    """
+
+    name = 'rental'
+
+    def __init__(self, role='customer', pricing_strategy='standard'):
+        """
+        Args:
+            role: Rôle de config.ini utilisé pour se connecter.
+            pricing_strategy: Stratégie de prix envoyée au backend.
+        """
+        self.username, self.password = ReadConfig.getCredentials(role)
+        self.pricing_strategy = pricing_strategy
+
+    def run(self, client, recorder):
+        """
+        Exécuter le parcours une fois.
+
+        Args:
+            client: ApiClient partagé.
+            recorder: Recorder qui chronomètre chaque appel.
+
+        Raises:
+            JourneyAborted: Si une étape renvoie un statut inattendu.
+        """
+        response = self._step(recorder, 'POST /api/auth/login', client.post, '/api/auth/login',
+                              json={'username': self.username, 'password': self.password})
+        token = response.json()['token']
+
+        profile = self._step(recorder, 'GET /api/users/me', client.get, '/api/users/me', token=token).json()
+
+        vehicles = self._step(recorder, 'GET /api/vehicles', client.get, '/api/vehicles').json()
+        available = [v for v in vehicles if v.get('status') in (0, 'Available')] or vehicles
+        if not available:
+            raise JourneyAborted('Aucun vehicule disponible')
+        vehicle = random.choice(available)
+
+        # Fenêtre aléatoire dans le futur pour limiter les conflits entre utilisateurs
+        start = datetime.utcnow().replace(microsecond=0) + timedelta(days=random.randint(30, 3000))
+        end = start + timedelta(days=random.randint(1, 7))
+        rental = {
+            'userId': profile['id'],
+            'vehicleId': vehicle['id'],
+            'startDate': start.isoformat(),
+            'endDate': end.isoformat(),
+            'pricingStrategy': self.pricing_strategy,
+        }
+
+        self._step(recorder, 'POST /api/rentals/calculate-price', client.post,
+                   '/api/rentals/calculate-price', json=rental, token=token)
+        created = self._step(recorder, 'POST /api/rentals', client.post, '/api/rentals',
+                             json=rental, token=token).json()
+        self._step(recorder, 'PUT /api/rentals/{id}/cancel', client.put,
+                   f"/api/rentals/{created['id']}/cancel", token=token)
+
+    @staticmethod
+    def _step(recorder, endpoint, send, *args, **kwargs):
+        response = recorder.timed(endpoint, send, *args, **kwargs)
+        if response is None or response.status_code >= 400:
+            status = 'erreur reseau' if response is None else response.status_code
+            raise JourneyAborted(f'{endpoint}: {status}')
+        return response
+
+
+class ReportsJourney:
+    """
+    Parcours back-office : login employé puis consultation des rapports
+    exposés par ReportsController.
+    """
+
+    name = 'reports'
+
+    def __init__(self, role='employee'):
+        self.username, self.password = ReadConfig.getCredentials(role)
+
+    def run(self, client, recorder):
+        response = RentalJourney._step(recorder, 'POST /api/auth/login', client.post, '/api/auth/login',
+                                       json={'username': self.username, 'password': self.password})
+        token = response.json()['token']
+        for endpoint in ('/api/reports/dashboard',
+                         '/api/reports/rentals/statistics',
+                         '/api/reports/vehicles/utilization',
+                         '/api/reports/revenue/monthly'):
+            RentalJourney._step(recorder, f'GET {endpoint}', client.get, endpoint, token=token)
+
+
+JOURNEYS = {
+    RentalJourney.name: RentalJourney,
+    ReportsJourney.name: ReportsJourney,
+}
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Export des résultats de charge en JSON et en HTML.
+"""
+import html
+import json
+import os
+from datetime import datetime
+
+COLUMNS = ['count', 'errors', 'throughput_rps', 'min', 'mean', 'p50', 'p95', 'p99', 'max']
+
+
+def writeJson(results, path):
+    """Écrire les résultats bruts en JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+def writeHtml(results, path):
+    """Écrire un rapport HTML autonome (tableau par endpoint)."""
+    rows = []
+    for endpoint, stats in results['endpoints'].items():
+        cells = ''.join(f'<td>{stats.get(column, "")}</td>' for column in COLUMNS)
+        css = ' class="error"' if stats.get('errors') else ''
+        rows.append(f'<tr{css}><td>{html.escape(endpoint)}</td>{cells}</tr>')
+
+    aborts = ''.join(f'<li>{html.escape(reason)} : {count}</li>'
+                     for reason, count in results['abort_reasons'].items())
+    header = ''.join(f'<th>{column}</th>' for column in COLUMNS)
+    content = f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8" />
+<title>Test de charge - {html.escape(results['journey'])}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2rem; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+td:first-child {{ text-align: left; font-family: monospace; }}
+tr.error td {{ background: #fee2e2; }}
+</style>
+</head>
+<body>
+<h1>Test de charge : parcours "{html.escape(results['journey'])}"</h1>
+<p>API : {html.escape(results['api_url'])} &mdash; {results['users']} utilisateurs,
+ramp-up {results['ramp_up_s']} s, durée {results['duration_s']} s</p>
+<p>Requêtes : {results['total_requests']} ({results['throughput_rps']} req/s) &mdash;
+parcours terminés : {results['journeys']['completed']}, interrompus : {results['journeys']['aborted']}</p>
+<p>Latences en millisecondes.</p>
+<table>
+<tr><th>Endpoint</th>{header}</tr>
+{''.join(rows)}
+</table>
+<ul>{aborts}</ul>
+<p><small>Généré le {datetime.now():%Y-%m-%d %H:%M:%S}</small></p>
+</body>
+</html>
+"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def writeReports(results, output_dir):
+    """
+    Écrire load_<parcours>_<horodatage>.json et .html dans output_dir.
+
+    Returns:
+        tuple: (chemin JSON, chemin HTML)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, f"load_{results['journey']}_{datetime.now():%Y%m%d_%H%M%S}")
+    writeJson(results, base + '.json')
+    writeHtml(results, base + '.html')
+    return base + '.json', base + '.html'
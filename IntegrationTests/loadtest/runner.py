@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Moteur de charge : utilisateurs virtuels (threads) qui rejouent un parcours
+en boucle, avec une montée en charge progressive (ramp-up).
+"""
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+from loadtest.journeys import JourneyAborted
+from utilities.apiClient import ApiClient
+from utilities.latencyStats import summarize
+
+
+class Recorder:
+    """Collecte thread-safe des latences et erreurs par endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.journeys = {'completed': 0, 'aborted': 0}
+        self.abort_reasons = defaultdict(int)
+
+    def timed(self, endpoint, send, *args, **kwargs):
+        """
+        Chronométrer un appel HTTP et l'enregistrer sous le nom d'endpoint.
+
+        Returns:
+            requests.Response: La réponse, ou None en cas d'erreur réseau.
+        """
+        start = time.perf_counter()
+        try:
+            response = send(*args, **kwargs)
+        except requests.exceptions.RequestException:
+            response = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.samples[endpoint].append(elapsed_ms)
+            if response is None or response.status_code >= 400:
+                self.errors[endpoint] += 1
+        return response
+
+    def journeyDone(self, aborted_reason=None):
+        with self._lock:
+            if aborted_reason is None:
+                self.journeys['completed'] += 1
+            else:
+                self.journeys['aborted'] += 1
+                self.abort_reasons[aborted_reason] += 1
+
+
+class LoadRunner:
+    """
+    Lance `users` utilisateurs virtuels répartis sur `ramp_up` secondes,
+    chacun rejouant le parcours jusqu'à la fin de la durée (ou du nombre
+    d'itérations demandé).
+    """
+
+    def __init__(self, api_url, journey, users=10, ramp_up=10, duration=60, iterations=None):
+        """
+        Args:
+            api_url: URL de base de l'API backend.
+            journey: Parcours à rejouer (voir loadtest/journeys.py).
+            users: Nombre d'utilisateurs virtuels simultanés.
+            ramp_up: Durée en secondes pour démarrer tous les utilisateurs.
+            duration: Durée maximale du test en secondes.
+            iterations: Nombre de parcours par utilisateur (None = illimité).
+        """
+        self.api_url = api_url
+        self.journey = journey
+        self.users = max(1, users)
+        self.ramp_up = max(0, ramp_up)
+        self.duration = duration
+        self.iterations = iterations
+        self.recorder = Recorder()
+        self._stop = threading.Event()
+
+    def run(self):
+        """
+        Exécuter le test de charge.
+
+        Returns:
+            dict: Les résultats (voir buildResults()).
+        """
+        client = ApiClient(self.api_url, pool_size=self.users)
+        threads = []
+        started_at = time.perf_counter()
+        deadline = started_at + self.duration if self.duration else None
+        try:
+            for index in range(self.users):
+                thread = threading.Thread(target=self._virtualUser, args=(client, deadline),
+                                          name=f'vu-{index}', daemon=True)
+                thread.start()
+                threads.append(thread)
+                if self.ramp_up and index < self.users - 1:
+                    time.sleep(self.ramp_up / self.users)
+            for thread in threads:
+                thread.join()
+        except KeyboardInterrupt:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            client.close()
+        return self.buildResults(time.perf_counter() - started_at)
+
+    def _virtualUser(self, client, deadline):
+        done = 0
+        while not self._stop.is_set():
+            if deadline and time.perf_counter() >= deadline:
+                return
+            if self.iterations is not None and done >= self.iterations:
+                return
+            try:
+                self.journey.run(client, self.recorder)
+                self.recorder.journeyDone()
+            except JourneyAborted as e:
+                self.recorder.journeyDone(str(e))
+            except Exception as e:
+                self.recorder.journeyDone(f'{type(e).__name__}: {e}')
+            done += 1
+
+    def buildResults(self, elapsed):
+        """Agréger débit et percentiles de latence par endpoint."""
+        recorder = self.recorder
+        endpoints = {}
+        total_requests = 0
+        for endpoint, samples in sorted(recorder.samples.items()):
+            total_requests += len(samples)
+            stats = summarize(samples)
+            stats['errors'] = recorder.errors[endpoint]
+            stats['throughput_rps'] = round(len(samples) / elapsed, 2) if elapsed else None
+            endpoints[endpoint] = stats
+        return {
+            'journey': self.journey.name,
+            'api_url': self.api_url,
+            'users': self.users,
+            'ramp_up_s': self.ramp_up,
+            'duration_s': round(elapsed, 2),
+            'total_requests': total_requests,
+            'throughput_rps': round(total_requests / elapsed, 2) if elapsed else None,
+            'journeys': dict(recorder.journeys),
+            'abort_reasons': dict(recorder.abort_reasons),
+            'endpoints': endpoints,
+        }
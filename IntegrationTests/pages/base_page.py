@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Classe de base des Page Objects
+Pattern: Page Object Model (POM)
+
+Centralise la résolution des éléments (cache + nouvelle tentative sur élément
+obsolète), les attentes explicites, les lectures JavaScript groupées et le
+chronométrage. Les Page Objects n'appellent plus driver.find_element
+directement : une optimisation faite ici profite à toutes les pages.
+"""
+from pages.element_cache import ElementCache, batchQuery
+from pages.waits import Wait, blazor_rendered, css_count_at_least, css_visible
+from utilities.readProperties import ReadConfig
+
+
+class BasePage:
+    """
+    Page Object de base.
+    Les sous-classes déclarent leurs localisateurs CSS en attributs de classe
+    et décorent leurs méthodes publiques avec @timedStep().
+    """
+
+    def __init__(self, driver):
+        """
+        Initialiser la page.
+
+        Args:
+            driver: Instance du WebDriver Selenium
+        """
+        self.driver = driver
+        self.wait = Wait(driver, timeout=ReadConfig.getExplicitWait())
+        self.elements = ElementCache(driver)
+
+    # -- Attentes -------------------------------------------------------------
+
+    def waitUntil(self, condition, message=''):
+        """Attendre une condition (voir pages.waits), TimeoutException sinon."""
+        return self.wait.until(condition, message)
+
+    def waitHolds(self, condition, timeout=None):
+        """Attendre une condition et renvoyer True/False au lieu de lever une exception."""
+        return self.wait.holds(condition, timeout=timeout)
+
+    def waitForBlazor(self, css=None):
+        """
+        Attendre le rendu Blazor, puis éventuellement un élément de la page.
+
+        Returns:
+            bool: True si la page (et l'élément) sont rendus avant l'expiration
+        """
+        if not self.waitHolds(blazor_rendered()):
+            return False
+        if css and not self.waitHolds(css_count_at_least(css)):
+            return False
+        self.elements.refresh()
+        return True
+
+    # -- Éléments -------------------------------------------------------------
+
+    def find(self, css):
+        """Renvoyer l'élément du sélecteur (depuis le cache si possible)."""
+        return self.elements.get(css)
+
+    def act(self, css, action):
+        """Appliquer une action à un élément, avec nouvelle tentative s'il est obsolète."""
+        return self.elements.call(css, action)
+
+    def type(self, css, text):
+        """Vider un champ puis y saisir le texte."""
+        def typeText(field):
+            field.clear()
+            field.send_keys(text)
+        self.act(css, typeText)
+
+    def click(self, css, navigates=False):
+        """
+        Cliquer sur un élément.
+
+        Args:
+            navigates: True si le clic change de page (le cache est alors vidé)
+        """
+        self.act(css, lambda element: element.click())
+        if navigates:
+            self.elements.invalidate()
+
+    def isVisible(self, css):
+        """Vérifier sans attendre qu'un élément du sélecteur est visible."""
+        try:
+            return bool(css_visible(css)(self.driver))
+        except Wait.ignored_exceptions:
+            return False
+
+    def readAll(self, container_css, fields):
+        """
+        Lire des champs texte de tous les éléments d'une liste en un seul appel.
+
+        Returns:
+            list[dict]: Une entrée {nom: texte} par élément
+        """
+        result = batchQuery(self.driver, container_css, fields)
+        self.elements.observe(result['version'])
+        return result['items']
+
+    # -- Navigation -----------------------------------------------------------
+
+    def open(self, url):
+        """Naviguer vers une URL (le cache d'éléments est vidé)."""
+        self.elements.invalidate()
+        self.driver.get(url)
+
+    def getCurrentURL(self):
+        """Retourner l'URL actuelle"""
+        return self.driver.current_url
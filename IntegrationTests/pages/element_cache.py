@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Cache de localisateurs et lectures groupées pour les Page Objects
+- ElementCache : réutilise les WebElement déjà trouvés, invalidés à la
+  navigation, sur mutation du DOM ou dès qu'un élément devient obsolète.
+- batchQuery : lit en UNE seule exécution JavaScript le texte de plusieurs
+  champs pour tous les éléments d'une liste (ex: titre, prix, statut de
+  chaque carte véhicule) au lieu d'un aller-retour WebDriver par élément.
+"""
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+# Installe (une fois par document) un compteur de version du DOM, incrémenté
+# par un MutationObserver. Un nouveau document repart à 1 : une navigation
+# change donc aussi la version observée.
+_DOM_VERSION_JS = """
+if (!window.__pomDomVersion) {
+    window.__pomDomVersion = 1;
+    window.__pomDocumentId = Math.random().toString(36).slice(2);
+    new MutationObserver(function () { window.__pomDomVersion++; })
+        .observe(document.documentElement, {childList: true, subtree: true});
+}
+var version = window.__pomDocumentId + ':' + window.__pomDomVersion;
+"""
+
+_BATCH_QUERY_JS = _DOM_VERSION_JS + """
+var containers = document.querySelectorAll(arguments[0]);
+var fields = arguments[1];
+var items = [];
+for (var i = 0; i < containers.length; i++) {
+    var item = {};
+    for (var name in fields) {
+        var matches = containers[i].querySelectorAll(fields[name][0]);
+        var index = fields[name][1] < 0 ? matches.length + fields[name][1] : fields[name][1];
+        var match = matches[index];
+        item[name] = match ? match.textContent.trim() : null;
+    }
+    items.push(item);
+}
+return {version: version, url: window.location.href, items: items};
+"""
+
+_DOM_VERSION_ONLY_JS = _DOM_VERSION_JS + 'return version;'
+
+
+def batchQuery(driver, container_css, fields):
+    """
+    Lire des champs texte pour chaque élément d'une liste, en un seul appel.
+
+    Args:
+        driver: Instance du WebDriver Selenium
+        container_css: Sélecteur des éléments de la liste (ex: cartes)
+        fields: {nom: (sélecteur relatif, index)} ; index -1 = dernière occurrence
+
+    Returns:
+        dict: {'version': version du DOM, 'url': URL, 'items': [{nom: texte}]}
+    """
+    fields = {name: list(spec) for name, spec in fields.items()}
+    return driver.execute_script(_BATCH_QUERY_JS, container_css, fields)
+
+
+class ElementCache:
+    """
+    Cache des WebElement par sélecteur CSS.
+
+    L'invalidation est automatique :
+    - observe(version) : la version du DOM renvoyée par batchQuery/domVersion
+      a changé (mutation ou nouveau document) ;
+    - call() : un élément obsolète (StaleElementReferenceException) est
+      recherché à nouveau puis l'action est rejouée une fois.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements = {}
+        self.version = None
+
+    def get(self, css):
+        """Renvoyer l'élément du sélecteur, depuis le cache si possible."""
+        element = self._elements.get(css)
+        if element is None:
+            element = self.driver.find_element(By.CSS_SELECTOR, css)
+            self._elements[css] = element
+        return element
+
+    def call(self, css, action):
+        """
+        Appliquer une action à l'élément mis en cache, avec une nouvelle
+        recherche si l'élément est devenu obsolète.
+
+        Args:
+            css: Sélecteur CSS de l'élément
+            action: Fonction recevant le WebElement
+        """
+        try:
+            return action(self.get(css))
+        except StaleElementReferenceException:
+            self.invalidate()
+            return action(self.get(css))
+
+    def observe(self, version):
+        """Invalider le cache si la version du DOM a changé depuis la dernière lecture."""
+        if version != self.version:
+            self._elements.clear()
+            self.version = version
+
+    def refresh(self):
+        """Lire la version du DOM (un aller-retour) et invalider si nécessaire."""
+        self.observe(self.driver.execute_script(_DOM_VERSION_ONLY_JS))
+
+    def invalidate(self):
+        """Vider le cache (ex: après driver.get ou un clic qui navigue)."""
+        self._elements.clear()
+        self.version = None
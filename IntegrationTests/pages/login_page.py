@@ -3,11 +3,12 @@
 Page Object Model pour la page de connexion
 Pattern: Page Object Model (POM)
 """
-from selenium.webdriver.common.by import By
-from time import sleep
+from pages.base_page import BasePage
+from pages.waits import any_of, blazor_rendered, css_count_at_least, css_visible, url_not_contains
+from utilities.telemetry import timedStep
 
 
-class LoginPage:
+class LoginPage(BasePage):
     """
     Page Object pour la page de connexion.
     Encapsule toutes les interactions avec la page /login.
@@ -19,15 +20,26 @@ class LoginPage:
     button_login_css = 'button[type="submit"]'
     error_message_css = '.mud-alert-error, .mud-snackbar-content-message'
     
-    def __init__(self, driver):
+    @timedStep('wait')
+    def waitForPage(self):
+        """Attendre que Blazor ait rendu le formulaire de connexion."""
+        self.waitUntil(blazor_rendered(), 'Blazor n\'a pas fini le rendu de /login')
+        self.waitUntil(css_count_at_least(self.textbox_password_css),
+                       'Le formulaire de connexion n\'est pas affiché')
+        self.elements.refresh()
+    
+    @timedStep('wait')
+    def waitForLoginResult(self):
         """
-        Initialiser la LoginPage.
+        Attendre l'issue d'une tentative de connexion : redirection hors de /login
+        ou affichage d'un message d'erreur.
         
-        Args:
-            driver: Instance du WebDriver Selenium
+        Returns:
+            bool: True si une issue a été observée avant l'expiration.
         """
-        self.driver = driver
+        return self.waitHolds(any_of(url_not_contains('/login'), css_visible(self.error_message_css)))
     
+    @timedStep()
     def setUserName(self, username):
         """
         Entrer le nom d'utilisateur dans le champ approprié.
@@ -35,10 +47,9 @@ class LoginPage:
         Args:
             username: Nom d'utilisateur à saisir
         """
-        username_field = self.driver.find_element(By.CSS_SELECTOR, self.textbox_username_css)
-        username_field.clear()
-        username_field.send_keys(username)
+        self.type(self.textbox_username_css, username)
     
+    @timedStep()
     def setPassword(self, password):
         """
         Entrer le mot de passe.
@@ -46,15 +57,14 @@ class LoginPage:
         Args:
             password: Mot de passe à saisir
         """
-        password_field = self.driver.find_element(By.CSS_SELECTOR, self.textbox_password_css)
-        password_field.clear()
-        password_field.send_keys(password)
+        self.type(self.textbox_password_css, password)
     
+    @timedStep()
     def clickLogin(self):
         """Cliquer sur le bouton de connexion"""
-        login_btn = self.driver.find_element(By.CSS_SELECTOR, self.button_login_css)
-        login_btn.click()
+        self.click(self.button_login_css, navigates=True)
     
+    @timedStep()
     def isErrorDisplayed(self):
         """
         Vérifier si un message d'erreur est affiché.
@@ -62,16 +72,9 @@ class LoginPage:
         Returns:
             bool: True si un message d'erreur est visible
         """
-        try:
-            error = self.driver.find_element(By.CSS_SELECTOR, self.error_message_css)
-            return error.is_displayed()
-        except:
-            return False
-    
-    def getCurrentURL(self):
-        """Retourner l'URL actuelle"""
-        return self.driver.current_url
+        return self.isVisible(self.error_message_css)
     
+    @timedStep('wait')
     def isLoginSuccessful(self):
         """
         Vérifier si la connexion a réussi (redirection).
@@ -79,6 +82,4 @@ class LoginPage:
         Returns:
             bool: True si redirigé vers dashboard/home ou admin
         """
-        sleep(2)  # Attendre la redirection
-        current_url = self.driver.current_url.lower()
-        return '/login' not in current_url
+        return self.waitHolds(url_not_contains('/login'))
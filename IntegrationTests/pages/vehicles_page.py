@@ -3,11 +3,12 @@
 Page Object Model pour la page des vehicules
 Pattern: Page Object Model (POM)
 """
-from selenium.webdriver.common.by import By
-from time import sleep
+from pages.base_page import BasePage
+from pages.waits import Wait, dom_quiet
+from utilities.telemetry import timedStep
 
 
-class VehiclesPage:
+class VehiclesPage(BasePage):
     """
     Page Object pour la page des vehicules.
     Encapsule toutes les interactions avec la page /vehicles.
@@ -16,17 +17,25 @@ class VehiclesPage:
     # Localisateurs
     vehicle_card_css = '.mud-card, .vehicle-card'
     search_input_css = 'input[type="search"], input[placeholder*="Search"], input[placeholder*="Rechercher"]'
-    vehicle_title_css = '.mud-card-header, .vehicle-title, h6'
+    vehicle_title_css = '.mud-card-header, .vehicle-title, h5, h6'
+    # Champs lus en un seul appel JavaScript : (sélecteur dans la carte, index)
+    vehicle_card_fields = {
+        'title': (vehicle_title_css, 0),
+        'price': ('h5', -1),
+        'status': ('.mud-chip', 0),
+    }
     
-    def __init__(self, driver):
+    @timedStep('wait')
+    def waitForVehicles(self):
         """
-        Initialiser la VehiclesPage.
+        Attendre que Blazor ait rendu la page et qu'au moins une carte soit affichée.
         
-        Args:
-            driver: Instance du WebDriver Selenium
+        Returns:
+            bool: True si des vehicules sont affiches avant l'expiration
         """
-        self.driver = driver
+        return self.waitForBlazor(self.vehicle_card_css)
     
+    @timedStep()
     def getVehicleCardsCount(self):
         """
         Obtenir le nombre de cartes de vehicules affichees.
@@ -35,11 +44,21 @@ class VehiclesPage:
             int: Nombre de vehicules affiches
         """
         try:
-            cards = self.driver.find_elements(By.CSS_SELECTOR, self.vehicle_card_css)
-            return len(cards)
-        except:
+            return len(self.getVehicleCards())
+        except Wait.ignored_exceptions:
             return 0
     
+    @timedStep()
+    def getVehicleCards(self):
+        """
+        Lire titre, prix et statut de toutes les cartes en un seul aller-retour.
+        
+        Returns:
+            list[dict]: {'title', 'price', 'status'} par carte affichee
+        """
+        return self.readAll(self.vehicle_card_css, self.vehicle_card_fields)
+    
+    @timedStep()
     def searchVehicle(self, search_term):
         """
         Rechercher un vehicule.
@@ -48,13 +67,13 @@ class VehiclesPage:
             search_term: Terme de recherche
         """
         try:
-            search_input = self.driver.find_element(By.CSS_SELECTOR, self.search_input_css)
-            search_input.clear()
-            search_input.send_keys(search_term)
-            sleep(1)  # Attendre que la recherche se complete
-        except:
-            pass
+            self.type(self.search_input_css, search_term)
+        except Wait.ignored_exceptions:
+            return
+        # Attendre que le filtrage soit termine (plus de re-rendu du DOM)
+        self.waitHolds(dom_quiet())
     
+    @timedStep()
     def isVehicleDisplayed(self, vehicle_name):
         """
         Verifier si un vehicule specifique est affiche.
@@ -65,15 +84,9 @@ class VehiclesPage:
         Returns:
             bool: True si le vehicule est trouve
         """
+        vehicle_name = vehicle_name.lower()
         try:
-            titles = self.driver.find_elements(By.CSS_SELECTOR, self.vehicle_title_css)
-            for title in titles:
-                if vehicle_name.lower() in title.text.lower():
-                    return True
+            return any(vehicle_name in (card['title'] or '').lower()
+                       for card in self.getVehicleCards())
+        except Wait.ignored_exceptions:
             return False
-        except:
-            return False
-    
-    def getCurrentURL(self):
-        """Retourner l'URL actuelle"""
-        return self.driver.current_url
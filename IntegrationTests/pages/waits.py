@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Moteur d'attente explicite pour les Page Objects
+Remplace les sleep() fixes : une condition est interrogée avec un intervalle
+croissant (back-off) et l'attente se termine dès qu'elle est vérifiée.
+"""
+import time
+import uuid
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+
+class Wait:
+    """
+    Attente explicite avec back-off adaptatif.
+
+    Les premières vérifications sont très rapprochées (la plupart des conditions
+    sont vraies presque tout de suite), puis l'intervalle augmente pour ne pas
+    saturer le navigateur de commandes WebDriver.
+    """
+
+    # Exceptions transitoires pendant un rendu Blazor ou une navigation
+    ignored_exceptions = (
+        NoSuchElementException,
+        StaleElementReferenceException,
+        JavascriptException,
+    )
+
+    def __init__(self, driver, timeout=10, initial_interval=0.05, max_interval=0.5, backoff=1.5):
+        """
+        Initialiser l'attente.
+
+        Args:
+            driver: Instance du WebDriver Selenium
+            timeout: Durée maximale d'attente en secondes
+            initial_interval: Premier intervalle entre deux vérifications
+            max_interval: Intervalle maximal entre deux vérifications
+            backoff: Facteur de croissance de l'intervalle
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+    def until(self, condition, message='', timeout=None):
+        """
+        Attendre que la condition renvoie une valeur vraie.
+
+        Args:
+            condition: Fonction recevant le driver et renvoyant une valeur
+            message: Message de l'exception en cas d'expiration
+            timeout: Surcharge ponctuelle du délai maximal
+
+        Returns:
+            La première valeur vraie renvoyée par la condition.
+
+        Raises:
+            TimeoutException: Si la condition n'est pas vérifiée à temps.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        interval = self.initial_interval
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except self.ignored_exceptions:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message or f'Condition non vérifiée après {timeout}s')
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def holds(self, condition, timeout=None):
+        """
+        Variante booléenne de until() : renvoie False au lieu de lever une exception.
+
+        Returns:
+            bool: True si la condition a été vérifiée avant l'expiration.
+        """
+        try:
+            return bool(self.until(condition, timeout=timeout))
+        except TimeoutException:
+            return False
+
+
+# ---------------------------------------------------------------------------
+# Conditions réutilisables
+# Les vérifications du DOM passent par JavaScript (querySelectorAll) pour ne pas
+# être bloquées par l'attente implicite de find_element(s).
+# ---------------------------------------------------------------------------
+
+def blazor_rendered():
+    """Blazor a chargé et rendu le composant racine (écran de chargement retiré)."""
+    script = (
+        "return document.readyState === 'complete'"
+        " && !!window.Blazor"
+        " && !document.getElementById('app-loading');"
+    )
+    return lambda driver: driver.execute_script(script)
+
+
+def url_contains(fragment):
+    """L'URL courante contient le fragment (insensible à la casse)."""
+    fragment = fragment.lower()
+    return lambda driver: fragment in driver.current_url.lower()
+
+
+def url_not_contains(fragment):
+    """L'URL courante ne contient plus le fragment (ex: '/login')."""
+    fragment = fragment.lower()
+    return lambda driver: fragment not in driver.current_url.lower()
+
+
+def css_count_at_least(css, count=1):
+    """Au moins `count` éléments correspondent au sélecteur CSS."""
+    script = 'return document.querySelectorAll(arguments[0]).length;'
+
+    def condition(driver):
+        found = driver.execute_script(script, css)
+        return found if found >= count else 0
+    return condition
+
+
+def css_visible(css):
+    """Au moins un élément correspondant au sélecteur CSS est visible."""
+    script = (
+        'return Array.prototype.some.call(document.querySelectorAll(arguments[0]),'
+        ' function (e) { return e.getClientRects().length > 0; });'
+    )
+    return lambda driver: driver.execute_script(script, css)
+
+
+def dom_quiet(quiet_seconds=0.3):
+    """
+    Le DOM n'a pas changé depuis `quiet_seconds` (fin d'un re-rendu Blazor,
+    ex: filtrage de la liste après une recherche).
+
+    Le silence est mesuré à partir du début de l'attente (premier appel de la
+    condition), pas de la dernière mutation connue : un DOM calme avant
+    l'action ne valide pas la condition avant que le re-rendu ait pu commencer.
+    """
+    # Jeton propre à cette attente : le premier appel fixe son instant de départ
+    wait_id = uuid.uuid4().hex
+    script = (
+        'if (!window.__pomQuietObserver) {'
+        '  window.__pomQuietObserver = true;'
+        '  window.__pomLastMutation = 0;'
+        '  new MutationObserver(function () { window.__pomLastMutation = Date.now(); })'
+        '    .observe(document.body, {childList: true, subtree: true, characterData: true});'
+        '}'
+        'if (window.__pomQuietWait !== arguments[1]) {'
+        '  window.__pomQuietWait = arguments[1];'
+        '  window.__pomQuietSince = Date.now();'
+        '}'
+        'return Date.now() - Math.max(window.__pomLastMutation, window.__pomQuietSince) >= arguments[0];'
+    )
+    return lambda driver: driver.execute_script(script, int(quiet_seconds * 1000), wait_id)
+
+
+def any_of(*conditions):
+    """Au moins une des conditions est vérifiée (renvoie sa valeur)."""
+    def condition(driver):
+        for cond in conditions:
+            try:
+                value = cond(driver)
+                if value:
+                    return value
+            except Wait.ignored_exceptions:
+                pass
+        return False
+    return condition
@@ -1,14 +1,14 @@
 # -*- coding: utf-8 -*-
 import pytest
 import requests
-import random
 
 @pytest.mark.api
 @pytest.mark.auth
 @pytest.mark.integration
 class TestAuthenticationAPI:
     
-    def test_TC011_login_valid_credentials_returns_token(self, api_url):
+    @pytest.mark.smoke
+    def test_TC011_login_valid_credentials_returns_token(self, api_client):
         """Test login with valid credentials returns JWT token"""
         login_data = {
             'username': 'admin',
@@ -16,7 +16,7 @@ class TestAuthenticationAPI:
         }
         
         try:
-            response = requests.post(f'{api_url}/api/auth/login', json=login_data, timeout=5)
+            response = api_client.post('/api/auth/login', json=login_data)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running. Start Backend with 'dotnet run' in Backend folder")
         except requests.exceptions.Timeout:
@@ -34,7 +34,7 @@ class TestAuthenticationAPI:
             assert 'username' in data, "Response should contain 'username'"
             assert 'email' in data, "Response should contain 'email'"
     
-    def test_TC012_login_invalid_password_returns_unauthorized(self, api_url):
+    def test_TC012_login_invalid_password_returns_unauthorized(self, api_client):
         """Test login with invalid password returns 401 Unauthorized"""
         login_data = {
             'username': 'admin',
@@ -42,7 +42,7 @@ class TestAuthenticationAPI:
         }
         
         try:
-            response = requests.post(f'{api_url}/api/auth/login', json=login_data, timeout=5)
+            response = api_client.post('/api/auth/login', json=login_data)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running. Start Backend with 'dotnet run' in Backend folder")
         except requests.exceptions.Timeout:
@@ -55,12 +55,12 @@ class TestAuthenticationAPI:
         ('invaliduser', ''),
         ('nonexistentuser', 'SomePassword123'),
     ])
-    def test_TC013_login_invalid_inputs(self, api_url, username, password):
+    def test_TC013_login_invalid_inputs(self, api_client, username, password):
         """Test login with various invalid inputs returns error"""
         login_data = {'username': username, 'password': password}
         
         try:
-            response = requests.post(f'{api_url}/api/auth/login', json=login_data, timeout=5)
+            response = api_client.post('/api/auth/login', json=login_data)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -68,18 +68,14 @@ class TestAuthenticationAPI:
         
         assert response.status_code in [400, 401], f"Expected 400 or 401, got {response.status_code}"
     
-    def test_TC014_register_valid_data_returns_success(self, api_url):
+    def test_TC014_register_valid_data_returns_success(self, api_client, data_factory):
         """Test registration with valid data returns success"""
-        username = f'testuser{random.randint(1000, 9999)}'
-        register_data = {
-            'username': username,
-            'email': f'{username}@test.com',
-            'password': 'Test@123456',
-            'role': 'Customer'
-        }
+        # Unique username per run (deleted by the data_factory teardown)
+        register_data = data_factory.userData(prefix='testuser')
+        username = register_data['username']
         
         try:
-            response = requests.post(f'{api_url}/api/auth/register', json=register_data, timeout=5)
+            response = api_client.post('/api/auth/register', json=register_data)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -92,19 +88,16 @@ class TestAuthenticationAPI:
             data = response.json()
             assert 'token' in data, "Response should contain token"
             assert data['username'] == username, f"Username should match: {username}"
+            data_factory.trackUser(data['token'])
     
-    def test_TC015_register_duplicate_username_returns_error(self, api_url):
+    def test_TC015_register_duplicate_username_returns_error(self, api_client, data_factory):
         """Test registration with duplicate username returns error"""
-        # First registration
-        username = f'duplicate{random.randint(1000, 9999)}'
-        register_data = {
-            'username': username,
-            'email': f'{username}@test.com',
-            'password': 'Test@123456'
-        }
+        # First registration (unique username per run, deleted by the data_factory teardown)
+        register_data = data_factory.userData(prefix='duplicate')
+        username = register_data['username']
         
         try:
-            response1 = requests.post(f'{api_url}/api/auth/register', json=register_data, timeout=5)
+            response1 = api_client.post('/api/auth/register', json=register_data)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -113,6 +106,7 @@ class TestAuthenticationAPI:
         # Only test duplicate if first registration succeeded
         if response1.status_code != 200:
             pytest.skip(f"First registration failed with {response1.status_code}, cannot test duplicate")
+        data_factory.trackUser(response1.json()['token'])
         
         # Second registration with same username
         register_data2 = {
@@ -122,7 +116,7 @@ class TestAuthenticationAPI:
         }
         
         try:
-            response2 = requests.post(f'{api_url}/api/auth/register', json=register_data2, timeout=5)
+            response2 = api_client.post('/api/auth/register', json=register_data2)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Attribution des commandes WebDriver par DriverProfiler (navigateur simulé,
+aucun navigateur ni backend requis).
+"""
+from pages.login_page import LoginPage
+from pages.vehicles_page import VehiclesPage
+from utilities.driverProfiler import DriverProfiler
+
+
+class FakeElement:
+    """WebElement simulé : chaque action passe par driver.execute()."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def clear(self):
+        self.driver.execute('clearElement')
+
+    def send_keys(self, text):
+        self.driver.execute('sendKeysToElement', {'text': text})
+
+    def click(self):
+        self.driver.execute('clickElement')
+
+
+class FakeDriver:
+    """Navigateur simulé : find_element, execute_script et get appellent execute()."""
+
+    def execute(self, driver_command, params=None):
+        return True
+
+    def find_element(self, by, value):
+        self.execute('findElement', {'using': by, 'value': value})
+        return FakeElement(self)
+
+    def execute_script(self, script, *args):
+        return self.execute('executeScript', {'script': script, 'args': list(args)})
+
+    def get(self, url):
+        self.execute('get', {'url': url})
+
+
+class TestDriverProfiler:
+
+    def test_commands_attributed_to_page_object_methods(self):
+        """Les commandes sont attribuées à la méthode publique du Page Object, pas aux helpers"""
+        driver = FakeDriver()
+        profiler = DriverProfiler.attach(driver)
+        profiler.start()
+
+        login_page = LoginPage(driver)
+        login_page.setUserName('admin')
+        login_page.clickLogin()
+        VehiclesPage(driver).searchVehicle('Toyota')
+        driver.get('http://localhost/vehicles')
+        profiler.stop()
+
+        callers = {(row['caller'], row['command']) for row in profiler.summary()}
+        assert callers == {
+            ('LoginPage.setUserName', 'findElement'),
+            ('LoginPage.setUserName', 'clearElement'),
+            ('LoginPage.setUserName', 'sendKeysToElement'),
+            ('LoginPage.clickLogin', 'findElement'),
+            ('LoginPage.clickLogin', 'clickElement'),
+            ('VehiclesPage.searchVehicle', 'findElement'),
+            ('VehiclesPage.searchVehicle', 'clearElement'),
+            ('VehiclesPage.searchVehicle', 'sendKeysToElement'),
+            ('VehiclesPage.searchVehicle', 'executeScript'),
+            ('test_commands_attributed_to_page_object_methods', 'get'),
+        }
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Sondes de démarrage et porte smoke (sessions, nœuds xdist et tests simulés :
+aucun backend ni navigateur requis).
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import conftest
+from utilities import telemetry, testImpact
+from utilities.healthCheck import ProbeResult, SmokeGate, describeFailures, runProbes
+
+# Port local sans service : connexion refusée immédiatement
+UNREACHABLE_URL = 'http://127.0.0.1:9'
+
+
+def fakeItem(nodeid, smoke=False):
+    marker = object() if smoke else None
+    return SimpleNamespace(nodeid=nodeid, config=None,
+                           get_closest_marker=lambda name: marker if name == 'smoke' else None)
+
+
+class TestHealthCheck:
+
+    def test_describe_failures_by_scope(self):
+        """Un seul message par portée, listant chaque sonde en échec avec son détail"""
+        results = [
+            ProbeResult('backend joignable', 'backend', True, None),
+            ProbeResult('login admin', 'backend', False, 'HTTP 401 pour admin'),
+            ProbeResult('base de données', 'backend', False, 'GET /api/vehicles -> HTTP 500'),
+            ProbeResult('frontend joignable', 'frontend', True, None),
+        ]
+        assert describeFailures(results, 'backend') == (
+            'Environnement indisponible - login admin (HTTP 401 pour admin); '
+            'base de données (GET /api/vehicles -> HTTP 500)')
+        assert describeFailures(results, 'frontend') is None
+
+    def test_probes_report_unreachable_environment(self):
+        """Backend et frontend injoignables : toutes les sondes échouent sans lever d'exception"""
+        results = runProbes(UNREACHABLE_URL, UNREACHABLE_URL, timeout=2)
+        assert [result.name for result in results if not result.ok] == [
+            'backend joignable', 'login admin', 'base de données', 'frontend joignable']
+        assert all('ConnectionError' in result.detail for result in results)
+        assert describeFailures(results, 'frontend').startswith('Environnement indisponible')
+
+    def test_smoke_gate_shared_between_instances(self, tmp_path):
+        """L'échec écrit par un worker est lu par les autres ; sans fichier, il reste local"""
+        path = str(tmp_path / 'smoke.failed')
+        worker_a, worker_b = SmokeGate(path), SmokeGate(path)
+        assert worker_b.check() is None
+        worker_a.fail('test_TC011: call en échec')
+        assert worker_b.check() == 'test_TC011: call en échec'
+        worker_a.cleanup()
+        assert SmokeGate(path).check() is None
+
+        local = SmokeGate()
+        local.fail('test_TC018: call en échec')
+        assert local.check() == 'test_TC018: call en échec'
+        assert SmokeGate().check() is None
+
+    def test_smoke_failure_propagates_to_xdist_workers(self, request):
+        """Contrôleur -> nœuds xdist -> workers : un échec smoke sur un worker ignore les tests non smoke des autres"""
+        controller = SimpleNamespace(option=SimpleNamespace(collectonly=True))
+        conftest.pytest_sessionstart(SimpleNamespace(config=controller))
+        try:
+            workers = []
+            for _ in range(2):
+                node = SimpleNamespace(config=controller, workerinput={})
+                conftest.pytest_configure_node(node)
+                worker = SimpleNamespace(workerinput=node.workerinput)
+                conftest.pytest_sessionstart(SimpleNamespace(config=worker))
+                workers.append(worker)
+            assert workers[0].smoke_gate.path == workers[1].smoke_gate.path == controller.smoke_gate.path
+
+            workers[0].smoke_gate.fail('test_TC011: call en échec')
+
+            smoke_item = fakeItem('tests/test_x.py::test_smoke', smoke=True)
+            smoke_item.config = workers[1]
+            conftest.pytest_runtest_setup(smoke_item)
+
+            other_item = fakeItem('tests/test_x.py::test_other')
+            other_item.config = workers[1]
+            with pytest.raises(pytest.skip.Exception, match='test_TC011'):
+                conftest.pytest_runtest_setup(other_item)
+        finally:
+            controller.smoke_gate.cleanup()
+            # pytest_runtest_setup a rattaché la télémétrie aux faux tests
+            telemetry.setCurrentTest(request.node.nodeid)
+            testImpact.startTest(request.node.nodeid)
@@ -1,8 +1,9 @@
 import pytest
-from time import sleep
 from pages.login_page import LoginPage
+from pages.waits import Wait, blazor_rendered
 from utilities.readProperties import ReadConfig
 from utilities.customLogger import LogGen
+from utilities.workerContext import getScreenshotPath
 
 
 class Test_001_Login:
@@ -27,19 +28,17 @@ class Test_001_Login:
         self.driver = setup
         self.logger.log_info(f"**** Opening URL: {self.baseURL} ****")
         self.driver.get(self.baseURL)
-        sleep(2)
+        Wait(self.driver, timeout=ReadConfig.getExplicitWait()).holds(blazor_rendered())
         
         actualTitle = self.driver.title
         self.logger.log_info(f"**** Page title: {actualTitle} ****")
         
         if "Car Rental" in actualTitle or "Blazor" in actualTitle:
             self.logger.log_info("**** Home page title test passed ****")
-            self.driver.close()
             assert True
         else:
             self.logger.log_error("**** Home page title test failed ****")
-            self.driver.save_screenshot("./Screenshots/test_homePageTitle.png")
-            self.driver.close()
+            self.driver.save_screenshot(getScreenshotPath("test_homePageTitle"))
             assert False
     
     @pytest.mark.ui
@@ -50,32 +49,27 @@ class Test_001_Login:
         
         self.driver = setup
         self.driver.get(f"{self.baseURL}/login")
-        sleep(3)  # Attendre que Blazor charge
         
         # Création de l'instance de LoginPage
         self.loginPage = LoginPage(self.driver)
+        self.loginPage.waitForPage()  # Attendre que Blazor charge
         
         self.logger.log_info(f"**** Setting username: {self.username} ****")
         self.loginPage.setUserName(self.username)
-        sleep(1)
         
         self.logger.log_info("**** Setting password ****")
         self.loginPage.setPassword(self.password)
-        sleep(1)
         
         self.logger.log_info("**** Clicking login button ****")
         self.loginPage.clickLogin()
-        sleep(3)
         
         # Vérifier si la connexion a réussi
         if self.loginPage.isLoginSuccessful():
             self.logger.log_info("**** Login test passed ****")
-            self.driver.close()
             assert True
         else:
             self.logger.log_error("**** Login test failed ****")
-            self.driver.save_screenshot("./Screenshots/test_login.png")
-            self.driver.close()
+            self.driver.save_screenshot(getScreenshotPath("test_login"))
             assert False
     
     @pytest.mark.ui
@@ -86,31 +80,27 @@ class Test_001_Login:
         
         self.driver = setup
         self.driver.get(f"{self.baseURL}/login")
-        sleep(3)  # Attendre que Blazor charge
         
         # Création de l'instance de LoginPage
         self.loginPage = LoginPage(self.driver)
+        self.loginPage.waitForPage()  # Attendre que Blazor charge
         
         self.logger.log_info(f"**** Setting username: {self.username} ****")
         self.loginPage.setUserName(self.username)
-        sleep(1)
         
         self.logger.log_info("**** Setting wrong password ****")
         self.loginPage.setPassword("WrongPassword123")
-        sleep(1)
         
         self.logger.log_info("**** Clicking login button ****")
         self.loginPage.clickLogin()
-        sleep(3)
+        self.loginPage.waitForLoginResult()
         
         # Vérifier qu'un message d'erreur est affiché ou que l'utilisateur reste sur /login
         current_url = self.loginPage.getCurrentURL()
         if "/login" in current_url.lower() or self.loginPage.isErrorDisplayed():
             self.logger.log_info("**** Invalid login test passed - Error displayed ****")
-            self.driver.close()
             assert True
         else:
             self.logger.log_error("**** Invalid login test failed - No error displayed ****")
-            self.driver.save_screenshot("./Screenshots/test_login_invalid.png")
-            self.driver.close()
+            self.driver.save_screenshot(getScreenshotPath("test_login_invalid"))
             assert False
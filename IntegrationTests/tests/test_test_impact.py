@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Règles de sélection des tests impactés (carte et dépôt simulés : aucun
+backend ni navigateur requis).
+"""
+import subprocess
+
+from utilities.testImpact import changedFiles, normalizePath, selectImpacted
+
+TESTS_MAP = {
+    'tests/test_vehicles_api.py::TestVehiclesAPI::test_list': {
+        'file': 'tests/test_vehicles_api.py', 'markers': [],
+        'endpoints': ['GET /api/vehicles/{id}'], 'pages': [],
+    },
+    'tests/test_auth_api.py::TestAuthenticationAPI::test_login': {
+        'file': 'tests/test_auth_api.py', 'markers': ['auth'],
+        'endpoints': ['POST /api/auth/login'], 'pages': [],
+    },
+    'tests/test_vehicles_ui.py::Test_002_Vehicles::test_browse': {
+        'file': 'tests/test_vehicles_ui.py', 'markers': [],
+        'endpoints': [], 'pages': ['/vehicles/browse/12'],
+    },
+    'tests/test_rentals_api.py::TestRentalsAPI::test_create': {
+        'file': 'tests/test_rentals_api.py', 'markers': ['rentals'],
+        'endpoints': ['POST /api/rentals'], 'pages': [],
+    },
+}
+NEW_TEST = 'tests/test_new.py::test_not_in_map'
+ALL_TESTS = list(TESTS_MAP) + [NEW_TEST]
+
+
+def select(changed, repo_root='.'):
+    return selectImpacted(ALL_TESTS, TESTS_MAP, changed, str(repo_root))
+
+
+class TestTestImpact:
+
+    def test_normalize_path(self):
+        """Identifiants numériques et GUID remplacés par {id}, query string ignorée"""
+        assert normalizePath('http://localhost:5001/api/Vehicles/12?x=1') == '/api/vehicles/{id}'
+        assert normalizePath('/api/users/0f8fad5b-d9cb-469f-a165-70867728950e/') == '/api/users/{id}'
+
+    def test_controller_selects_tests_calling_its_endpoints(self):
+        """Contrôleur modifié : tests appelant ses endpoints (et les nouveaux tests)"""
+        assert select(['Backend/Controllers/VehiclesController.cs']) == {
+            'tests/test_vehicles_api.py::TestVehiclesAPI::test_list', NEW_TEST}
+
+    def test_razor_page_selects_tests_opening_its_route(self, tmp_path):
+        """Page Razor modifiée : tests ayant ouvert une de ses routes @page"""
+        page = tmp_path / 'Frontend' / 'Pages' / 'BrowseCars.razor'
+        page.parent.mkdir(parents=True)
+        page.write_text('@page "/vehicles/browse/{Id:int}"\n<h1>Browse</h1>\n', encoding='utf-8')
+        assert select(['Frontend/Pages/BrowseCars.razor'], tmp_path) == {
+            'tests/test_vehicles_ui.py::Test_002_Vehicles::test_browse', NEW_TEST}
+
+    def test_domain_marker_matches_singular_file_name(self):
+        """Marker de domaine au pluriel ('rentals') retrouvé dans un nom de fichier au singulier"""
+        assert select(['Backend/Services/RentalService.cs']) == {
+            'tests/test_rentals_api.py::TestRentalsAPI::test_create', NEW_TEST}
+
+    def test_shared_file_selects_all_tests(self):
+        """Code partagé (Program.cs, fichiers de IntegrationTests hors tests) : tout relancer"""
+        assert select(['Backend/Program.cs']) == set(ALL_TESTS)
+        assert select(['IntegrationTests/conftest.py']) == set(ALL_TESTS)
+
+    def test_modified_test_file_selects_its_tests(self):
+        assert select(['IntegrationTests/tests/test_auth_api.py']) == {
+            'tests/test_auth_api.py::TestAuthenticationAPI::test_login', NEW_TEST}
+
+    def test_files_outside_code_dirs_are_ignored(self):
+        """Documentation : seuls les nouveaux tests (absents de la carte) sont lancés"""
+        assert select(['Documentation/guide.md', 'README.md']) == {NEW_TEST}
+
+    def test_changed_files_include_untracked(self, tmp_path):
+        """Un nouveau fichier pas encore ajouté à git compte comme modifié"""
+        def git(*args):
+            subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@test.com', *args],
+                           cwd=tmp_path, check=True, capture_output=True)
+        git('init', '-q')
+        (tmp_path / 'Program.cs').write_text('// v1\n', encoding='utf-8')
+        git('add', '.')
+        git('commit', '-q', '-m', 'init')
+        (tmp_path / 'Program.cs').write_text('// v2\n', encoding='utf-8')
+        (tmp_path / 'Controllers').mkdir()
+        (tmp_path / 'Controllers' / 'NewController.cs').write_text('// new\n', encoding='utf-8')
+        assert changedFiles('HEAD', str(tmp_path)) == ['Program.cs', 'Controllers/NewController.cs']
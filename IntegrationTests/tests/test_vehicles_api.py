@@ -1,16 +1,18 @@
 # -*- coding: utf-8 -*-
 import pytest
 import requests
+from utilities.asyncApiClient import assertAllStatus, connectionErrors
 
 @pytest.mark.api
 @pytest.mark.vehicles
 @pytest.mark.integration
 class TestVehiclesAPI:
     
-    def test_TC018_get_all_vehicles(self, api_url):
+    @pytest.mark.smoke
+    def test_TC018_get_all_vehicles(self, api_client):
         """Test GET /api/vehicles returns success or requires auth"""
         try:
-            response = requests.get(f'{api_url}/api/vehicles', timeout=5)
+            response = api_client.get('/api/vehicles')
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running. Start Backend with 'dotnet run' in Backend folder")
         except requests.exceptions.Timeout:
@@ -23,10 +25,10 @@ class TestVehiclesAPI:
             data = response.json()
             assert isinstance(data, list), "Response should be a list of vehicles"
     
-    def test_TC019_get_vehicle_by_id_existing(self, api_url):
+    def test_TC019_get_vehicle_by_id_existing(self, api_client):
         """Test GET /api/vehicles/{id} with existing ID"""
         try:
-            response = requests.get(f'{api_url}/api/vehicles/1', timeout=5)
+            response = api_client.get('/api/vehicles/1')
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -39,10 +41,10 @@ class TestVehiclesAPI:
             data = response.json()
             assert 'id' in data or 'Id' in data, "Vehicle should have an id field"
     
-    def test_TC020_get_vehicle_by_id_nonexisting(self, api_url):
+    def test_TC020_get_vehicle_by_id_nonexisting(self, api_client):
         """Test GET /api/vehicles/{id} with non-existing ID returns 404 or 401"""
         try:
-            response = requests.get(f'{api_url}/api/vehicles/99999', timeout=5)
+            response = api_client.get('/api/vehicles/99999')
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -51,18 +53,13 @@ class TestVehiclesAPI:
         # Should be 404 (not found) or 401 (auth required)
         assert response.status_code in [401, 404], f"Expected 401 or 404, got {response.status_code}"
     
-    def test_TC021_get_vehicles_with_auth_token(self, api_url, auth_token):
+    def test_TC021_get_vehicles_with_auth_token(self, api_client, auth_token):
         """Test GET /api/vehicles with authentication token"""
         if not auth_token:
             pytest.skip("Could not obtain auth token. Check if admin user exists")
         
-        headers = {
-            'Authorization': f'Bearer {auth_token}',
-            'Content-Type': 'application/json'
-        }
-        
         try:
-            response = requests.get(f'{api_url}/api/vehicles', headers=headers, timeout=5)
+            response = api_client.get('/api/vehicles', token=auth_token)
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -72,11 +69,11 @@ class TestVehiclesAPI:
         data = response.json()
         assert isinstance(data, list), "Response should be a list"
     
-    def test_TC022_search_vehicles_by_query(self, api_url):
+    def test_TC022_search_vehicles_by_query(self, api_client):
         """Test vehicle search functionality"""
         try:
             # Try searching for vehicles with query parameter
-            response = requests.get(f'{api_url}/api/vehicles?search=car', timeout=5)
+            response = api_client.get('/api/vehicles?search=car')
         except requests.exceptions.ConnectionError:
             pytest.skip("API is not running")
         except requests.exceptions.Timeout:
@@ -84,3 +81,14 @@ class TestVehiclesAPI:
         
         # Should return 200 or 401
         assert response.status_code in [200, 401], f"Expected 200 or 401, got {response.status_code}"
+    
+    def test_TC047_get_vehicles_by_id_concurrently(self, async_api_client):
+        """Test GET /api/vehicles/{id} for many IDs in one concurrent batch"""
+        calls = [('GET', f'/api/vehicles/{vehicle_id}') for vehicle_id in range(1, 201)]
+        results = async_api_client.run(async_api_client.gather(calls))
+        
+        if len(connectionErrors(results)) == len(results):
+            pytest.skip("API is not running")
+        
+        # Each ID should be found (200), missing (404) or require auth (401)
+        assertAllStatus(results, [200, 401, 404])
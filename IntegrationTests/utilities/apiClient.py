@@ -0,0 +1,69 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utilities import testImpact
+from utilities.readProperties import ReadConfig
+
+
+class ApiClient(requests.Session):
+    """
+    Client HTTP partagé par tous les tests API.
+
+    Basé sur une session requests : les connexions TCP sont gardées ouvertes
+    (keep-alive) dans un pool et réutilisées d'une requête à l'autre.
+    Les erreurs de connexion sont retentées avec back-off et chaque requête
+    reçoit le timeout par défaut de config.ini.
+
+    Exemple:
+        api_client.get('/api/vehicles')
+        api_client.post('/api/rentals', json=data, token=auth_token)
+    """
+
+    def __init__(self, base_url, pool_size=None, retries=None, backoff_factor=None, timeout=None):
+        """
+        Args:
+            base_url: URL de base de l'API (préfixée aux chemins commençant par '/').
+            pool_size: Nombre de connexions gardées ouvertes par hôte.
+            retries: Nombre de tentatives supplémentaires sur erreur de connexion.
+            backoff_factor: Facteur du back-off exponentiel entre tentatives.
+            timeout: Timeout par défaut (secondes) des requêtes.
+        """
+        super().__init__()
+        self.base_url = base_url.rstrip('/')
+        self.timeout = ReadConfig.getApiTimeout() if timeout is None else timeout
+        pool_size = ReadConfig.getApiPoolSize() if pool_size is None else pool_size
+        retries = ReadConfig.getApiRetries() if retries is None else retries
+        backoff_factor = ReadConfig.getApiBackoffFactor() if backoff_factor is None else backoff_factor
+
+        # Retenter uniquement les erreurs de connexion : une réponse HTTP
+        # (même 500) ou un timeout de lecture est un résultat de test.
+        retry = Retry(total=retries, connect=retries, read=0, status=0, other=0,
+                      backoff_factor=backoff_factor, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    def request(self, method, url, token=None, **kwargs):
+        """
+        Envoyer une requête via le pool de connexions.
+
+        Args:
+            method: Méthode HTTP.
+            url: Chemin relatif ('/api/...') ou URL absolue.
+            token: JWT optionnel ajouté dans l'en-tête Authorization.
+            **kwargs: Arguments de requests.Session.request.
+
+        Returns:
+            requests.Response: La réponse HTTP.
+        """
+        # Endpoints appelés par le test en cours (sélection des tests impactés)
+        testImpact.recordEndpoint(method, url)
+        if url.startswith('/'):
+            url = self.base_url + url
+        kwargs.setdefault('timeout', self.timeout)
+        if token:
+            headers = dict(kwargs.pop('headers', None) or {})
+            headers['Authorization'] = f'Bearer {token}'
+            kwargs['headers'] = headers
+        return super().request(method, url, **kwargs)
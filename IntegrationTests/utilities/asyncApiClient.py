@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from utilities.apiClient import ApiClient
+from utilities.readProperties import ReadConfig
+
+# Résultat d'une requête concurrente : la réponse ou l'exception levée
+ApiResult = namedtuple('ApiResult', ['method', 'url', 'response', 'error', 'elapsed'])
+
+
+class AsyncApiClient:
+    """
+    Client API asyncio pour envoyer de nombreuses requêtes en parallèle
+    depuis un même test (ex: vérifier des centaines d'identifiants de véhicules).
+
+    Les requêtes s'exécutent sur un pool de threads au-dessus d'un ApiClient
+    dont le pool keep-alive a la même taille : on garde le même client HTTP,
+    les mêmes retries et timeouts que les tests synchrones, sans dépendance
+    supplémentaire. La durée totale tend vers celle d'un aller-retour.
+
+    Exemple:
+        results = async_api_client.run(
+            async_api_client.gather([('GET', f'/api/vehicles/{i}') for i in ids]))
+        assertAllStatus(results, [200, 404])
+    """
+
+    def __init__(self, base_url, concurrency=None):
+        """
+        Args:
+            base_url: URL de base de l'API backend.
+            concurrency: Nombre maximal de requêtes simultanées.
+        """
+        self.concurrency = concurrency or ReadConfig.getApiConcurrency()
+        self.client = ApiClient(base_url, pool_size=self.concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency,
+                                            thread_name_prefix='api-client')
+
+    async def request(self, method, url, **kwargs):
+        """
+        Envoyer une requête sans bloquer la boucle asyncio.
+
+        Returns:
+            requests.Response: La réponse HTTP.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self.client.request, method, url, **kwargs))
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request('PUT', url, **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request('DELETE', url, **kwargs)
+
+    async def _timed(self, method, url, kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self.request(method, url, **kwargs)
+            return ApiResult(method, url, response, None, time.perf_counter() - start)
+        except Exception as e:
+            return ApiResult(method, url, None, e, time.perf_counter() - start)
+
+    async def gather(self, calls, **common_kwargs):
+        """
+        Envoyer un lot de requêtes en parallèle et attendre toutes les réponses.
+        Les erreurs sont capturées dans le résultat au lieu d'interrompre le lot.
+
+        Args:
+            calls: Itérable de (méthode, url) ou (méthode, url, kwargs).
+            **common_kwargs: Arguments appliqués à toutes les requêtes (ex: token=...).
+
+        Returns:
+            list[ApiResult]: Les résultats, dans l'ordre des appels.
+        """
+        tasks = []
+        for call in calls:
+            method, url = call[0], call[1]
+            kwargs = dict(common_kwargs)
+            if len(call) > 2:
+                kwargs.update(call[2])
+            tasks.append(self._timed(method, url, kwargs))
+        return await asyncio.gather(*tasks)
+
+    def run(self, coroutine):
+        """Exécuter une coroutine depuis un test pytest synchrone."""
+        return asyncio.run(coroutine)
+
+    def close(self):
+        """Libérer le pool de threads et les connexions HTTP."""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+
+def connectionErrors(results):
+    """Renvoyer les résultats en échec faute de réponse (API injoignable, timeout)."""
+    return [r for r in results if r.error is not None]
+
+
+def assertAllStatus(results, expected_statuses):
+    """
+    Vérifier en une fois que toutes les réponses ont un statut attendu.
+    Le message d'échec liste toutes les requêtes fautives, pas seulement la première.
+
+    Args:
+        results: Liste d'ApiResult renvoyée par gather().
+        expected_statuses: Statut attendu ou liste de statuts acceptés.
+    """
+    if isinstance(expected_statuses, int):
+        expected_statuses = [expected_statuses]
+    failures = []
+    for r in results:
+        if r.error is not None:
+            failures.append(f'{r.method} {r.url}: {type(r.error).__name__}: {r.error}')
+        elif r.response.status_code not in expected_statuses:
+            failures.append(f'{r.method} {r.url}: {r.response.status_code}')
+    assert not failures, (
+        f'{len(failures)}/{len(results)} requetes en echec (attendu {expected_statuses}):\n'
+        + '\n'.join(failures[:50]))
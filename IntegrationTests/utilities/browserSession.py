@@ -0,0 +1,33 @@
+import json
+
+# Ressource statique légère de l'origine du frontend : y naviguer suffit pour
+# écrire dans son localStorage sans démarrer l'application Blazor.
+ORIGIN_PAGE = '/favicon.png'
+
+# Clés utilisées par Frontend/Services/AuthService.cs (Blazored.LocalStorage
+# sérialise chaque valeur en JSON, d'où les guillemets autour des chaînes).
+STORAGE_KEYS = {'token': 'authToken', 'username': 'username', 'role': 'userRole'}
+
+_SET_STORAGE_JS = '''
+var items = arguments[0];
+for (var key in items) { window.localStorage.setItem(key, items[key]); }
+'''
+
+
+def injectSession(driver, base_url, session, path='/'):
+    """
+    Ouvrir le frontend déjà authentifié, sans passer par le formulaire /login.
+
+    Args:
+        driver: Instance du WebDriver Selenium
+        base_url: URL du frontend
+        session: Session renvoyée par TokenProvider.getSession() (token, username, role)
+        path: Page à ouvrir une fois la session injectée
+    """
+    base_url = base_url.rstrip('/')
+    driver.get(base_url + ORIGIN_PAGE)
+    items = {storage_key: json.dumps(session[field])
+             for field, storage_key in STORAGE_KEYS.items() if session.get(field) is not None}
+    driver.execute_script(_SET_STORAGE_JS, items)
+    driver.get(base_url + path)
+    return driver
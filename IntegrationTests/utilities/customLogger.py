@@ -1,19 +1,86 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import time
 from datetime import datetime
+from utilities.readProperties import ReadConfig
+from utilities.workerContext import getWorkerLogFile
+
+
+class BatchingHandler(logging.handlers.MemoryHandler):
+    """
+    Tampon d'écriture : les enregistrements sont écrits par lots dans le fichier,
+    quand le lot est plein, quand un message ERROR arrive, ou au plus tard
+    après `flush_interval` secondes (BatchingQueueListener vide le tampon
+    même si aucun nouveau message n'arrive).
+    """
+    
+    def __init__(self, capacity, target, flush_interval=1.0):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+    
+    def shouldFlush(self, record):
+        return (super().shouldFlush(record)
+                or time.monotonic() - self.last_flush >= self.flush_interval)
+    
+    def flush(self):
+        super().flush()
+        self.last_flush = time.monotonic()
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    Thread d'écoute qui attend les messages au plus `flush_interval` secondes :
+    sans nouveau message, il vide les tampons de ses handlers, pour que les
+    derniers messages d'une période calme ne restent pas en mémoire.
+    """
+    
+    def __init__(self, records, *handlers, flush_interval=1.0, respect_handler_level=False):
+        super().__init__(records, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+    
+    def dequeue(self, block):
+        if not block:
+            return self.queue.get(block=False)
+        while True:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
 
 class LogGen:
     """
     Classe pour générer des logs personnalisés pour les tests d'automatisation.
+    
+    En mode asynchrone ([logging] async = true), log_info() et consorts ne font
+    que déposer l'enregistrement dans une file en mémoire : un thread d'écoute
+    écrit les lots dans le fichier, sans bloquer le thread qui pilote le navigateur.
     """
     
-    def __init__(self, log_file=None):
+    # Threads d'écoute actifs en mode asynchrone : (QueueListener, BatchingHandler)
+    _listeners = []
+    
+    # Logger des événements structurés (JSON lines), séparé du log texte
+    events_logger_name = __name__ + '.events'
+    
+    def __init__(self, log_file=None, async_mode=None):
         """
         Initialise le logger avec un fichier de log spécifique.
         
         Args:
             log_file: Chemin du fichier de log. Si None, utilise un nom par défaut.
+                En exécution parallèle, le chemin est suffixé par l'identifiant
+                du worker (ex: automation.gw1.log) puis fusionné en fin de session.
+            async_mode: Écriture via file + thread d'écoute. Si None, lu dans config.ini.
         """
+        if async_mode is None:
+            async_mode = ReadConfig.getAsyncLogging()
         if log_file is None:
             # Créer le répertoire Logs s'il n'existe pas
             logs_dir = './Logs'
@@ -25,6 +92,8 @@ class LogGen:
             if log_dir:
                 os.makedirs(log_dir, exist_ok=True)
         
+        log_file = getWorkerLogFile(log_file)
+        
         # Configuration du logger
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -43,7 +112,78 @@ class LogGen:
             file_handler.setFormatter(formatter)
             
             # Ajouter le handler au logger
-            self.logger.addHandler(file_handler)
+            if async_mode:
+                self.logger.addHandler(self._startListener(file_handler))
+            else:
+                self.logger.addHandler(file_handler)
+    
+    @classmethod
+    def _startListener(cls, file_handler):
+        """
+        Démarrer le thread d'écoute qui écrit par lots dans file_handler.
+        
+        Returns:
+            logging.handlers.QueueHandler: Le handler à attacher au logger.
+        """
+        records = queue.SimpleQueue()
+        flush_interval = ReadConfig.getLogFlushInterval()
+        batching_handler = BatchingHandler(ReadConfig.getLogBatchSize(), file_handler, flush_interval)
+        listener = BatchingQueueListener(records, batching_handler, flush_interval=flush_interval,
+                                         respect_handler_level=True)
+        listener.start()
+        cls._listeners.append((listener, batching_handler))
+        return logging.handlers.QueueHandler(records)
+    
+    @classmethod
+    def flush(cls):
+        """
+        Écrire immédiatement tous les messages en attente (ex: après un échec de test).
+        La file est vidée par le thread d'écoute avant l'écriture du dernier lot.
+        """
+        for listener, batching_handler in cls._listeners:
+            listener.stop()
+            batching_handler.flush()
+            listener.start()
+    
+    @classmethod
+    def shutdown(cls):
+        """Vider les files, arrêter les threads d'écoute et fermer les fichiers (fin de session)."""
+        while cls._listeners:
+            listener, batching_handler = cls._listeners.pop()
+            listener.stop()
+            file_handler = batching_handler.target
+            batching_handler.close()
+            file_handler.close()
+        for name in (__name__, cls.events_logger_name):
+            logger = logging.getLogger(name)
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+    
+    @classmethod
+    def log_event(cls, event):
+        """
+        Enregistre un événement structuré dans ./Logs/telemetry.jsonl (une ligne JSON).
+        Utilisé par utilities/telemetry.py pour les durées des étapes et des tests.
+        
+        Args:
+            event: Dictionnaire sérialisable en JSON.
+        """
+        logger = logging.getLogger(cls.events_logger_name)
+        if not logger.handlers:
+            logger.setLevel(logging.INFO)
+            # Ne pas remonter les événements JSON dans automation.log
+            logger.propagate = False
+            logs_dir = './Logs'
+            os.makedirs(logs_dir, exist_ok=True)
+            file_handler = logging.FileHandler(
+                getWorkerLogFile(os.path.join(logs_dir, 'telemetry.jsonl')), mode='a', encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter('%(message)s'))
+            if ReadConfig.getAsyncLogging():
+                logger.addHandler(cls._startListener(file_handler))
+            else:
+                logger.addHandler(file_handler)
+        logger.info(json.dumps(event, default=str))
     
     def log_info(self, message):
         """
@@ -91,7 +231,7 @@ class LogGen:
         """
         logs_dir = './Logs'
         os.makedirs(logs_dir, exist_ok=True)
-        log_file = os.path.join(logs_dir, 'automation.log')
+        log_file = getWorkerLogFile(os.path.join(logs_dir, 'automation.log'))
         
         logging.basicConfig(
             filename=log_file,
@@ -102,3 +242,7 @@ class LogGen:
         logger = logging.getLogger()
         logger.setLevel(logging.INFO)
         return logger
+
+
+# Ne perdre aucun message si la session se termine sans appeler shutdown()
+atexit.register(LogGen.shutdown)
@@ -0,0 +1,215 @@
+"""
+Fabrique de données de test créées en masse via l'API du Backend.
+
+Toutes les entités portent l'étiquette de l'exécution (RUN_TAG) et un numéro
+unique : pas de collision entre exécutions, workers parallèles ou tests.
+Les créations d'un lot partent en parallèle (AsyncApiClient) et teardown()
+supprime en masse ce que la fabrique a créé, dans l'ordre des dépendances.
+
+Les locations sont permanentes : l'API n'a pas de DELETE /api/rentals et les
+clés étrangères Rental -> Vehicle/User sont en DeleteBehavior.Restrict. Une
+location créée est annulée au teardown, mais son véhicule, son client et la
+catégorie du véhicule ne peuvent plus être supprimés : ils passent dans le
+pool de l'exécution (RETAINED, noms tagués RUN_TAG) au lieu d'être signalés
+comme nettoyés.
+
+Exemple:
+    vehicles = data_factory.createVehicles(1000)
+    customer, = data_factory.createCustomers(1)
+    data_factory.createRentals([customer], vehicles[:1])
+"""
+import itertools
+import threading
+import uuid
+from datetime import date, timedelta
+
+from utilities.asyncApiClient import assertAllStatus
+from utilities.workerContext import getWorkerId
+
+# Étiquette de l'exécution (unique par processus, donc par worker)
+RUN_TAG = f'it{uuid.uuid4().hex[:8]}'
+
+# Entités conservées par l'exécution car liées à une location (voir plus haut)
+RETAINED = {'vehicles': set(), 'customers': set(), 'categories': set()}
+
+_sequence = itertools.count(1)
+_sequence_lock = threading.Lock()
+
+DEFAULT_PASSWORD = 'Test@123456'
+
+
+def uniqueName(prefix):
+    """Nom unique dans toutes les exécutions : <prefix>-<tag><worker>-<numéro>."""
+    with _sequence_lock:
+        number = next(_sequence)
+    worker = getWorkerId().replace('main', '')
+    return f'{prefix}-{RUN_TAG}{worker}-{number}'
+
+
+class DataFactory:
+    """
+    Création et suppression en masse de catégories, véhicules, clients et locations.
+    """
+
+    def __init__(self, async_client, token_provider):
+        """
+        Args:
+            async_client: AsyncApiClient (requêtes concurrentes).
+            token_provider: TokenProvider (token admin des créations/suppressions).
+        """
+        self.client = async_client
+        self.token_provider = token_provider
+        self.created = {'rentals': [], 'vehicles': [], 'categories': [], 'customers': []}
+        self.failures = []
+
+    @property
+    def token(self):
+        return self.token_provider.getToken('admin')
+
+    def _bulk(self, calls, expected_status, **common_kwargs):
+        """Envoyer un lot en parallèle, vérifier les statuts et renvoyer les corps JSON."""
+        results = self.client.run(self.client.gather(calls, **common_kwargs))
+        assertAllStatus(results, expected_status)
+        return [result.response.json() for result in results]
+
+    # -- Utilisateurs ---------------------------------------------------------
+
+    def userData(self, prefix='user', role='Customer'):
+        """Données d'inscription uniques (sans appel à l'API)."""
+        username = uniqueName(prefix)
+        return {'username': username, 'email': f'{username}@test.com',
+                'password': DEFAULT_PASSWORD, 'role': role}
+
+    def trackUser(self, token):
+        """
+        Prendre en charge la suppression d'un utilisateur inscrit par le test lui-même.
+
+        Args:
+            token: Le token renvoyé par /api/auth/register.
+
+        Returns:
+            L'identifiant de l'utilisateur, None s'il n'a pas pu être lu
+            (l'échec est alors signalé par teardown()).
+        """
+        result, = self.client.run(self.client.gather([('GET', '/api/users/me')], token=token))
+        user_id = None
+        if result.error is None and result.response.status_code == 200:
+            user_id = result.response.json().get('id')
+        if user_id is None:
+            self.failures.append('GET /api/users/me: utilisateur non suivi, suppression impossible')
+            return None
+        self.created['customers'].append(user_id)
+        return user_id
+
+    def createCustomers(self, count):
+        """
+        Inscrire `count` clients en parallèle.
+
+        Returns:
+            list[dict]: id, username, email, password et token de chaque client.
+        """
+        users = [self.userData() for _ in range(count)]
+        registered = self._bulk([('POST', '/api/auth/register', {'json': user}) for user in users], 200)
+        profiles = self._bulk([('GET', '/api/users/me', {'token': auth['token']}) for auth in registered], 200)
+        customers = []
+        for user, auth, profile in zip(users, registered, profiles):
+            self.created['customers'].append(profile['id'])
+            customers.append(dict(user, id=profile['id'], token=auth['token']))
+        return customers
+
+    # -- Catalogue ------------------------------------------------------------
+
+    def createCategories(self, count, **overrides):
+        """Créer `count` catégories en parallèle (renvoie les CategoryDto)."""
+        calls = [('POST', '/api/categories',
+                  {'json': dict({'name': uniqueName('Cat'), 'description': f'Test {RUN_TAG}',
+                                 'isActive': True, 'displayOrder': 0}, **overrides)})
+                 for _ in range(count)]
+        categories = self._bulk(calls, [200, 201], token=self.token)
+        self.created['categories'].extend(category['id'] for category in categories)
+        return categories
+
+    def createVehicles(self, count, category_id=None, **overrides):
+        """
+        Créer `count` véhicules disponibles en parallèle.
+
+        Args:
+            category_id: Catégorie des véhicules (une nouvelle catégorie sinon).
+            **overrides: Champs remplacés (ex: dailyRate=80).
+        """
+        if category_id is None:
+            category_id = self.createCategories(1)[0]['id']
+        calls = []
+        for _ in range(count):
+            name = uniqueName('V')
+            vehicle = {'brand': 'Test', 'model': name, 'registrationNumber': name, 'year': 2022,
+                       'categoryId': category_id, 'dailyRate': 50, 'status': 0, 'mileage': 0,
+                       'fuelType': 'Gasoline', 'seatingCapacity': 5}
+            vehicle.update(overrides)
+            calls.append(('POST', '/api/vehicles', {'json': vehicle}))
+        vehicles = self._bulk(calls, [200, 201], token=self.token)
+        self.created['vehicles'].extend(vehicle['id'] for vehicle in vehicles)
+        return vehicles
+
+    def createRentals(self, customers, vehicles, start_in_days=30, days=3):
+        """
+        Réserver un véhicule par client (associés deux à deux) en parallèle.
+        Les véhicules, clients et catégories concernés ne seront pas supprimés
+        au teardown (voir RETAINED).
+
+        Returns:
+            list[dict]: Les locations créées.
+        """
+        start = date.today() + timedelta(days=start_in_days)
+        calls = [('POST', '/api/rentals', {'json': {
+                    'userId': customer['id'], 'vehicleId': vehicle['id'],
+                    'startDate': start.isoformat(), 'endDate': (start + timedelta(days=days)).isoformat(),
+                    'pricingStrategy': 'standard'}})
+                 for customer, vehicle in zip(customers, vehicles)]
+        rentals = self._bulk(calls, [200, 201], token=self.token)
+        self.created['rentals'].extend(rental['id'] for rental in rentals)
+        pairs = list(zip(customers, vehicles))
+        self._retain('customers', [customer['id'] for customer, _ in pairs])
+        self._retain('vehicles', [vehicle['id'] for _, vehicle in pairs])
+        self._retain('categories', [vehicle.get('categoryId') for _, vehicle in pairs])
+        return rentals
+
+    def _retain(self, kind, ids):
+        """Retirer des entités de la liste à supprimer et les ajouter au pool de l'exécution."""
+        for id in ids:
+            if id is None:
+                continue
+            RETAINED[kind].add(id)
+            if id in self.created[kind]:
+                self.created[kind].remove(id)
+
+    # -- Nettoyage ------------------------------------------------------------
+
+    def teardown(self):
+        """
+        Supprimer en masse ce qui a été créé : locations annulées (pas de
+        suppression dans l'API), puis véhicules, catégories et clients qui ne
+        sont liés à aucune location (les autres restent dans RETAINED).
+
+        Returns:
+            list[str]: Les suppressions en échec (vide si tout est nettoyé).
+        """
+        phases = [
+            [('PUT', f'/api/rentals/{id}/cancel') for id in self.created['rentals']],
+            [('DELETE', f'/api/vehicles/{id}') for id in self.created['vehicles']],
+            [('DELETE', f'/api/categories/{id}') for id in self.created['categories']],
+            [('DELETE', f'/api/users/{id}') for id in self.created['customers']],
+        ]
+        failures, self.failures = self.failures, []
+        token = self.token
+        for calls in phases:
+            if not calls:
+                continue
+            for result in self.client.run(self.client.gather(calls, token=token)):
+                if result.error is not None:
+                    failures.append(f'{result.method} {result.url}: {type(result.error).__name__}')
+                elif result.response.status_code not in (200, 204, 404):
+                    failures.append(f'{result.method} {result.url}: {result.response.status_code}')
+        for ids in self.created.values():
+            ids.clear()
+        return failures
@@ -0,0 +1,102 @@
+"""
+Instantané de la base de données locale du Backend, restauré entre les modules.
+
+L'instantané et la restauration passent par l'API de sauvegarde de SQLite
+(sqlite3.Connection.backup), pas par une copie des fichiers : une copie des
+fichiers .db/-wal/-shm d'une base ouverte par le Backend n'est pas cohérente,
+et réécrire le -shm sous un processus qui l'a projeté en mémoire peut
+corrompre la base. La sauvegarde prend les verrous SQLite : l'instantané est
+cohérent même pendant des écritures, et la restauration est vue par les
+connexions du Backend comme une transaction ordinaire. Cela reste bien plus
+rapide que de relancer les migrations et les seeders.
+
+Ne jamais restaurer la base en copiant ses fichiers pendant que le Backend
+tourne : seule restore() (API de sauvegarde) est sûre dans ce cas.
+
+Le Backend doit utiliser une base fichier (SQLite) : configurer [database]
+db_file dans config.ini ; sans ce réglage, la fixture ne fait rien.
+"""
+import os
+import shutil
+import sqlite3
+import tempfile
+
+# Attente maximale des verrous posés par le Backend (secondes)
+LOCK_TIMEOUT = 30
+
+
+def _signature(path):
+    try:
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _backup(src_path, dst_path, read_only_source=False):
+    """Copier le contenu d'une base SQLite dans une autre via l'API de sauvegarde."""
+    if read_only_source:
+        src = sqlite3.connect(f'file:{src_path}?mode=ro', uri=True, timeout=LOCK_TIMEOUT)
+    else:
+        src = sqlite3.connect(src_path, timeout=LOCK_TIMEOUT)
+    try:
+        dst = sqlite3.connect(dst_path, timeout=LOCK_TIMEOUT)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+class DatabaseSnapshot:
+    """
+    Instantané d'une base SQLite pris et restauré par l'API de sauvegarde.
+    """
+
+    def __init__(self, db_file, snapshot_dir=None):
+        """
+        Args:
+            db_file: Chemin de la base du Backend.
+            snapshot_dir: Dossier de l'instantané (dossier temporaire sinon).
+        """
+        self.db_file = os.path.abspath(db_file)
+        self.snapshot_dir = snapshot_dir or tempfile.mkdtemp(prefix='db_snapshot_')
+        self.snapshot_file = os.path.join(self.snapshot_dir, os.path.basename(self.db_file))
+        self.signatures = {}
+
+    def _watchedFiles(self):
+        # Le -shm change aussi sur simple lecture : seuls la base et le -wal comptent
+        return [self.db_file, self.db_file + '-wal']
+
+    def _remember(self):
+        self.signatures = {path: _signature(path) for path in self._watchedFiles()}
+
+    def take(self):
+        """Sauvegarder la base dans l'instantané (une fois par session)."""
+        if not os.path.exists(self.db_file):
+            raise FileNotFoundError(f'Base de données introuvable: {self.db_file}')
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        _backup(self.db_file, self.snapshot_file, read_only_source=True)
+        self._remember()
+
+    def isDirty(self):
+        """True si la base a changé depuis l'instantané ou la dernière restauration."""
+        return any(_signature(path) != self.signatures.get(path) for path in self._watchedFiles())
+
+    def restore(self):
+        """
+        Remettre la base dans l'état de l'instantané, dans la base ouverte par le
+        Backend (rien à faire si elle n'a pas changé).
+
+        Returns:
+            bool: True si la base a été restaurée.
+        """
+        if not self.isDirty():
+            return False
+        _backup(self.snapshot_file, self.db_file)
+        self._remember()
+        return True
+
+    def cleanup(self):
+        shutil.rmtree(self.snapshot_dir, ignore_errors=True)
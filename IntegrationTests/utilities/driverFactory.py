@@ -0,0 +1,293 @@
+import functools
+import json
+import os
+import shutil
+import tempfile
+
+import urllib3
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from utilities import telemetry, testImpact
+from utilities.fileLock import FileLock
+from utilities.gridSlots import GridSaturatedError, GridSlot
+from utilities.readProperties import ReadConfig
+from utilities.workerContext import createChromeProfileDir
+
+# Arguments du profil allégé : pas d'images, d'extensions ni de trafic réseau
+# en arrière-plan (mises à jour de composants, synchronisation, métriques...)
+LIGHTWEIGHT_ARGS = (
+    '--blink-settings=imagesEnabled=false',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--mute-audio',
+)
+
+# Équivalent Firefox du profil allégé (préférences about:config)
+LIGHTWEIGHT_FIREFOX_PREFS = {
+    'permissions.default.image': 2,
+    'extensions.update.enabled': False,
+    'app.update.enabled': False,
+    'browser.safebrowsing.malware.enabled': False,
+    'browser.safebrowsing.phishing.enabled': False,
+    'datareporting.healthreport.uploadEnabled': False,
+    'datareporting.policy.dataSubmissionEnabled': False,
+    'network.prefetch-next': False,
+    'media.autoplay.default': 5,
+}
+
+# Binaires possibles de Chromium selon la distribution
+CHROMIUM_BINARIES = ('chromium', 'chromium-browser')
+
+BROWSERS = ('chrome', 'chromium', 'firefox')
+
+
+def parseBrowser(name):
+    """
+    Interpréter un nom de navigateur de config.ini ou de --browsers.
+
+    Args:
+        name: 'Chrome', 'chromium', 'firefox', 'chrome-headless', 'headless-firefox'...
+
+    Returns:
+        tuple: (navigateur, headless) ; headless vaut None s'il n'est pas imposé par le nom.
+
+    Raises:
+        ValueError: Si le navigateur n'est pas pris en charge.
+    """
+    parts = name.strip().lower().replace('_', '-').split('-')
+    headless = True if 'headless' in parts else None
+    parts = [part for part in parts if part != 'headless']
+    browser = parts[0] if parts else ''
+    if browser not in BROWSERS:
+        raise ValueError(f'Navigateur non pris en charge: {name} (attendu: {", ".join(BROWSERS)})')
+    return browser, headless
+
+
+# ---------------------------------------------------------------------------
+# Cache des chemins de pilotes (chromedriver, geckodriver)
+# Sans chemin explicite, Selenium Manager recherche (voire télécharge) le pilote
+# à chaque démarrage de navigateur. Le chemin résolu la première fois est gardé
+# dans un fichier JSON partagé entre les workers et les sessions.
+# ---------------------------------------------------------------------------
+
+def _driverCacheFile():
+    return ReadConfig.getDriverCacheFile() or os.path.join(
+        tempfile.gettempdir(), 'carrental-integration-drivers.json')
+
+
+def _readDriverCache():
+    try:
+        with open(_driverCacheFile(), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def getCachedDriverPath(browser):
+    """Chemin du pilote déjà résolu pour ce navigateur (None s'il n'existe plus)."""
+    path = _readDriverCache().get(browser)
+    return path if path and os.path.isfile(path) else None
+
+
+def cacheDriverPath(browser, path):
+    """Mémoriser (ou oublier si path est None) le chemin du pilote d'un navigateur."""
+    cache_file = _driverCacheFile()
+    with FileLock(cache_file + '.lock'):
+        cache = _readDriverCache()
+        if cache.get(browser) == path:
+            return
+        if path:
+            cache[browser] = path
+        else:
+            cache.pop(browser, None)
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+
+
+# ---------------------------------------------------------------------------
+# Options par navigateur
+# ---------------------------------------------------------------------------
+
+def chromeOptions(headless=None, lightweight=None, binary=None, remote=False):
+    """
+    Construire les options Chrome/Chromium du profil d'exécution ([selenium] de config.ini).
+
+    Args:
+        headless: Surcharge de `headless` (ex: False avec --headed).
+        lightweight: Surcharge de `lightweight`.
+        binary: Exécutable du navigateur (Chromium), celui par défaut sinon.
+        remote: True pour une session sur la grille (profil géré par le nœud).
+
+    Returns:
+        Options: Les options Chrome.
+    """
+    headless = ReadConfig.getHeadless() if headless is None else headless
+    lightweight = ReadConfig.getLightweightProfile() if lightweight is None else lightweight
+    width, height = ReadConfig.getWindowSize()
+
+    chrome_options = Options()
+    if binary:
+        chrome_options.binary_location = binary
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument(f'--window-size={width},{height}')
+    chrome_options.add_argument('--disable-gpu')
+    # Profil dédié : évite les conflits entre navigateurs des workers parallèles
+    if not remote:
+        chrome_options.add_argument(f'--user-data-dir={createChromeProfileDir()}')
+    chrome_options.page_load_strategy = ReadConfig.getPageLoadStrategy()
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    if lightweight:
+        for argument in LIGHTWEIGHT_ARGS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2})
+    return chrome_options
+
+
+def firefoxOptions(headless=None, lightweight=None):
+    """
+    Construire les options Firefox du profil d'exécution ([selenium] de config.ini).
+
+    Returns:
+        FirefoxOptions: Les options Firefox (profil temporaire propre à chaque instance).
+    """
+    headless = ReadConfig.getHeadless() if headless is None else headless
+    lightweight = ReadConfig.getLightweightProfile() if lightweight is None else lightweight
+    width, height = ReadConfig.getWindowSize()
+
+    firefox_options = FirefoxOptions()
+    firefox_options.add_argument(f'--width={width}')
+    firefox_options.add_argument(f'--height={height}')
+    firefox_options.page_load_strategy = ReadConfig.getPageLoadStrategy()
+    if headless:
+        firefox_options.add_argument('-headless')
+    if lightweight:
+        for name, value in LIGHTWEIGHT_FIREFOX_PREFS.items():
+            firefox_options.set_preference(name, value)
+    return firefox_options
+
+
+def _findChromium():
+    for name in CHROMIUM_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _startBrowser(browser, headless, lightweight, driver_path):
+    if browser == 'firefox':
+        return webdriver.Firefox(options=firefoxOptions(headless, lightweight),
+                                 service=FirefoxService(executable_path=driver_path))
+    binary = _findChromium() if browser == 'chromium' else None
+    return webdriver.Chrome(options=chromeOptions(headless, lightweight, binary),
+                            service=ChromeService(executable_path=driver_path))
+
+
+def _startLocal(browser, headless, lightweight):
+    """Démarrer le navigateur sur cette machine, avec le pilote en cache si possible."""
+    driver_path = getCachedDriverPath(browser)
+    try:
+        driver = _startBrowser(browser, headless, lightweight, driver_path)
+    except WebDriverException:
+        if driver_path is None:
+            raise
+        # Pilote en cache incompatible (navigateur mis à jour) : nouvelle résolution
+        cacheDriverPath(browser, None)
+        driver = _startBrowser(browser, headless, lightweight, None)
+    if driver.service.path:
+        cacheDriverPath(browser, driver.service.path)
+    return driver
+
+
+def _startRemote(browser, headless, lightweight, remote_url):
+    """
+    Ouvrir une session sur la grille dans la limite de `remote_max_sessions`.
+    La place est libérée à la fermeture du navigateur (quit), que DriverPool
+    appelle dès la fin du test.
+
+    Raises:
+        GridSaturatedError: Pas de place libre ou session refusée/expirée par la grille.
+    """
+    slot = GridSlot.acquire()
+    if browser == 'firefox':
+        options = firefoxOptions(headless, lightweight)
+    else:
+        # Chromium : le nœud de la grille fournit son propre binaire Chrome/Chromium
+        options = chromeOptions(headless, lightweight, remote=True)
+    # La création de session attend dans la file de la grille au plus remote_queue_timeout
+    client_config = ClientConfig(remote_server_addr=remote_url, timeout=ReadConfig.getRemoteQueueTimeout())
+    try:
+        driver = webdriver.Remote(command_executor=remote_url, options=options,
+                                  client_config=client_config)
+    except WebDriverException as e:
+        slot.release()
+        raise GridSaturatedError(f'Session refusée par la grille {remote_url}: {e.msg}') from e
+    except (OSError, urllib3.exceptions.HTTPError) as e:
+        # Grille injoignable ou délai de la file dépassé côté client
+        slot.release()
+        raise GridSaturatedError(f'Grille {remote_url} indisponible: {e}') from e
+    except BaseException:
+        slot.release()
+        raise
+
+    quit = driver.quit
+
+    @functools.wraps(quit)
+    def releasingQuit():
+        try:
+            quit()
+        finally:
+            slot.release()
+
+    driver.quit = releasingQuit
+    # Marque les navigateurs distants : DriverPool les ferme au lieu de les garder
+    driver.grid_slot = slot
+    return driver
+
+
+def createDriver(browser=None, headless=None, lightweight=None):
+    """
+    Créer une nouvelle instance de WebDriver configurée pour les tests.
+
+    Args:
+        browser: Navigateur (voir parseBrowser), `browser` de config.ini par défaut.
+        headless: Surcharge du mode headless (le suffixe -headless du nom l'impose).
+        lightweight: Surcharge du profil allégé.
+
+    Returns:
+        WebDriver: Une instance du WebDriver pour le navigateur demandé,
+        sur la grille si `remote_url` est configuré.
+
+    Raises:
+        GridSaturatedError: En mode grille, si aucune session n'est obtenue à temps.
+    """
+    browser, forced_headless = parseBrowser(browser or ReadConfig.getBrowser())
+    if forced_headless:
+        headless = True
+
+    remote_url = ReadConfig.getRemoteUrl()
+    if remote_url:
+        driver = _startRemote(browser, headless, lightweight, remote_url)
+    else:
+        driver = _startLocal(browser, headless, lightweight)
+    driver.implicitly_wait(ReadConfig.getImplicitWait())
+
+    # Pages ouvertes (sélection des tests impactés) et compteur de commandes (télémétrie)
+    testImpact.attachPageRecorder(driver)
+    return telemetry.attachCommandCounter(driver)
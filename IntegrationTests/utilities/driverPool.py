@@ -0,0 +1,132 @@
+import threading
+
+
+class DriverPool:
+    """
+    Pool de navigateurs WebDriver réutilisables pour les tests d'interface.
+
+    Le démarrage à froid de Chrome coûte plus cher que la plupart des tests UI.
+    Le pool garde des instances "chaudes" pendant toute la session (ou le worker)
+    et les remet dans un état propre entre deux tests au lieu de les recréer.
+    Exception : un navigateur de la grille Selenium (driver.grid_slot) est fermé
+    à la fin du test, pour ne pas garder une place de la grille inoccupée.
+    """
+
+    # Script exécuté sur l'origine courante pour vider le stockage du navigateur
+    clear_storage_js = (
+        'try { window.localStorage.clear(); } catch (e) {}'
+        'try { window.sessionStorage.clear(); } catch (e) {}'
+    )
+
+    def __init__(self, factory, max_size=1):
+        """
+        Initialise le pool.
+
+        Args:
+            factory: Fonction sans argument qui crée un nouveau WebDriver.
+            max_size: Nombre maximal de navigateurs gardés en réserve.
+        """
+        self.factory = factory
+        self.max_size = max(1, int(max_size))
+        self._idle = []
+        self._all = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Louer un navigateur du pool (ou en créer un nouveau si le pool est vide).
+
+        Returns:
+            WebDriver: Un navigateur prêt à l'emploi.
+        """
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                driver = self.factory()
+                with self._lock:
+                    self._all.append(driver)
+                return driver
+            if self.isAlive(driver):
+                return driver
+            self.discard(driver)
+
+    def release(self, driver):
+        """
+        Rendre un navigateur au pool après l'avoir réinitialisé.
+
+        Args:
+            driver: Le navigateur loué via acquire().
+        """
+        if getattr(driver, 'grid_slot', None) is not None:
+            # Session distante : rendre la place aux autres workers
+            self.discard(driver)
+            return
+
+        if not self.reset(driver):
+            self.discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(driver)
+                return
+
+        self.discard(driver)
+
+    def reset(self, driver):
+        """
+        Remettre un navigateur dans un état neutre entre deux tests :
+        cookies, localStorage et sessionStorage vidés, puis about:blank.
+
+        Returns:
+            bool: True si la réinitialisation a réussi.
+        """
+        try:
+            # Un test peut avoir ouvert des onglets supplémentaires
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Le stockage est lié à l'origine : le vider avant de quitter la page
+            driver.execute_script(self.clear_storage_js)
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def isAlive(driver):
+        """Vérifier que la session WebDriver répond toujours."""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def discard(self, driver):
+        """Fermer définitivement un navigateur et le retirer du pool."""
+        with self._lock:
+            if driver in self._idle:
+                self._idle.remove(driver)
+            if driver in self._all:
+                self._all.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Fermer tous les navigateurs du pool (fin de session)."""
+        with self._lock:
+            drivers = list(self._all)
+            self._idle.clear()
+            self._all.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,109 @@
+import functools
+import inspect
+import os
+import time
+from collections import defaultdict
+
+from pages.base_page import BasePage
+
+# Les appels venant de ce dossier sont attribués à la méthode du Page Object
+PAGES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pages')
+
+
+def _findCaller():
+    """
+    Retrouver la méthode de Page Object (ou à défaut le test) à l'origine
+    de la commande WebDriver en remontant la pile d'appels.
+
+    La commande est attribuée à la méthode de Page Object la plus externe
+    (ex: LoginPage.setUserName), pas aux helpers qu'elle appelle (BasePage.type,
+    ElementCache.get, lambdas et conditions d'attente de pages/).
+    """
+    frame = inspect.currentframe()
+    caller = None
+    try:
+        frame = frame.f_back.f_back
+        while frame is not None:
+            filename = os.path.abspath(frame.f_code.co_filename)
+            if filename.startswith(PAGES_DIR):
+                owner = frame.f_locals.get('self')
+                if isinstance(owner, BasePage):
+                    caller = f'{type(owner).__name__}.{frame.f_code.co_name}'
+            elif os.path.basename(filename).startswith('test_') and frame.f_code.co_name.startswith('test'):
+                return caller or frame.f_code.co_name
+            frame = frame.f_back
+        return caller or '<autre>'
+    finally:
+        del frame
+
+
+class DriverProfiler:
+    """
+    Profilage des commandes WebDriver d'un navigateur.
+
+    Chaque commande (findElement, sendKeysToElement, clickElement, get,
+    getTitle, getCurrentUrl...) est enregistrée avec sa latence et la méthode
+    de Page Object qui l'a déclenchée, pour chiffrer les allers-retours.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.entries = []
+        self.recording = False
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def profiledExecute(driver_command, params=None):
+            if not self.recording:
+                return execute(driver_command, params)
+            caller = _findCaller()
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.entries.append((driver_command, caller, (time.perf_counter() - start) * 1000))
+
+        driver.execute = profiledExecute
+        driver.profiler = self
+
+    @classmethod
+    def attach(cls, driver):
+        """Instrumenter un navigateur (une seule fois) et renvoyer son profileur."""
+        return getattr(driver, 'profiler', None) or cls(driver)
+
+    def start(self):
+        """Commencer un nouveau profil (début de test)."""
+        self.entries = []
+        self.recording = True
+
+    def stop(self):
+        self.recording = False
+
+    def summary(self):
+        """
+        Agréger le profil par (appelant, commande).
+
+        Returns:
+            list[dict]: caller, command, count, total_ms, mean_ms, triés par temps total.
+        """
+        groups = defaultdict(lambda: [0, 0.0])
+        for command, caller, elapsed_ms in self.entries:
+            group = groups[(caller, command)]
+            group[0] += 1
+            group[1] += elapsed_ms
+        rows = [{'caller': caller, 'command': command, 'count': count,
+                 'total_ms': round(total, 2), 'mean_ms': round(total / count, 2)}
+                for (caller, command), (count, total) in groups.items()]
+        rows.sort(key=lambda row: row['total_ms'], reverse=True)
+        return rows
+
+    def formatReport(self):
+        """Rendu texte du profil, pour la section du rapport pytest."""
+        rows = self.summary()
+        total_ms = sum(row['total_ms'] for row in rows)
+        lines = [f'{len(self.entries)} commandes WebDriver, {total_ms:.1f} ms au total',
+                 f"{'appelant':<40} {'commande':<28} {'nb':>5} {'total ms':>10} {'moy ms':>8}"]
+        for row in rows:
+            lines.append(f"{row['caller']:<40} {row['command']:<28} {row['count']:>5} "
+                         f"{row['total_ms']:>10.1f} {row['mean_ms']:>8.1f}")
+        return '\n'.join(lines)
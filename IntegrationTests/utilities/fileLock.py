@@ -0,0 +1,85 @@
+import os
+import time
+import uuid
+
+
+class FileLock:
+    """
+    Verrou inter-processus basé sur un fichier (création exclusive).
+
+    Fonctionne sous Windows comme sous Linux, sans dépendance externe.
+    Utilisé pour partager des fichiers de cache entre les workers parallèles.
+    Le fichier contient un jeton propre au détenteur : release() ne supprime
+    pas un verrou repris par un autre processus (ex: après expiration).
+    """
+
+    def __init__(self, path, timeout=30, stale_after=120, poll_interval=0.05):
+        """
+        Args:
+            path: Chemin du fichier verrou (ex: cache.json.lock).
+            timeout: Durée maximale d'attente du verrou en secondes.
+            stale_after: Âge au-delà duquel un verrou orphelin est supprimé.
+            poll_interval: Intervalle entre deux tentatives.
+        """
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.token = None
+
+    def acquire(self):
+        """
+        Prendre le verrou.
+
+        Raises:
+            TimeoutError: Si le verrou n'a pas pu être obtenu à temps.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            token = f'{os.getpid()}:{uuid.uuid4().hex}'
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, token.encode())
+                os.close(fd)
+                self.token = token
+                return
+            except FileExistsError:
+                self._removeIfStale()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'Impossible d\'obtenir le verrou {self.path}')
+            time.sleep(self.poll_interval)
+
+    def isOwned(self):
+        """Vérifier que le fichier verrou est toujours celui posé par acquire()."""
+        if self.token is None:
+            return False
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return f.read() == self.token
+        except OSError:
+            return False
+
+    def release(self):
+        """Libérer le verrou (sans effet s'il a été repris par un autre processus)."""
+        try:
+            if self.isOwned():
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        finally:
+            self.token = None
+
+    def _removeIfStale(self):
+        """Supprimer un verrou laissé par un processus interrompu."""
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
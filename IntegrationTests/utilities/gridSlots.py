@@ -0,0 +1,84 @@
+import os
+import tempfile
+import threading
+import time
+
+from utilities.fileLock import FileLock
+from utilities.readProperties import ReadConfig
+
+
+class GridSaturatedError(Exception):
+    """Aucune session distante n'a pu être obtenue à temps (grille saturée ou injoignable)."""
+
+
+class GridSlot:
+    """
+    Une place parmi les `remote_max_sessions` sessions autorisées sur la grille.
+
+    Les places sont des fichiers verrous partagés par tous les workers de la
+    machine : la suite n'ouvre jamais plus de sessions que la limite, les
+    demandes en trop attendent leur tour au lieu d'encombrer la file de la grille.
+    Un thread met à jour la date du fichier tant que la place est tenue, même
+    sans commande WebDriver (ex: test dont la suite n'appelle que l'API) ;
+    celle d'un processus interrompu est reprise après `stale_after` secondes.
+    """
+
+    # Intervalle entre deux mises à jour de la date du fichier
+    heartbeat_interval = 30
+
+    def __init__(self, lock):
+        self.lock = lock
+        self._released = threading.Event()
+        threading.Thread(target=self._heartbeat, name='grid-slot-heartbeat', daemon=True).start()
+
+    @classmethod
+    def acquire(cls, timeout=None, max_sessions=None, slot_dir=None):
+        """
+        Attendre une place libre.
+
+        Args:
+            timeout: Attente maximale en secondes (`remote_queue_timeout`).
+            max_sessions: Nombre de places (`remote_max_sessions`).
+            slot_dir: Dossier des fichiers verrous (dossier temporaire par défaut).
+
+        Raises:
+            GridSaturatedError: Si aucune place ne s'est libérée à temps.
+        """
+        timeout = ReadConfig.getRemoteQueueTimeout() if timeout is None else timeout
+        max_sessions = max_sessions or ReadConfig.getRemoteMaxSessions()
+        slot_dir = slot_dir or ReadConfig.getRemoteSlotDir() or os.path.join(
+            tempfile.gettempdir(), 'carrental-grid-slots')
+        os.makedirs(slot_dir, exist_ok=True)
+        stale_after = max(cls.heartbeat_interval * 10, timeout)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            for index in range(max_sessions):
+                lock = FileLock(os.path.join(slot_dir, f'slot-{index}.lock'),
+                                timeout=0, stale_after=stale_after)
+                try:
+                    lock.acquire()
+                    return cls(lock)
+                except TimeoutError:
+                    continue
+            if time.monotonic() >= deadline:
+                raise GridSaturatedError(
+                    f'Grille saturée : {max_sessions} sessions occupées depuis {timeout}s')
+            time.sleep(0.5)
+
+    def _heartbeat(self):
+        while not self._released.wait(self.heartbeat_interval):
+            self.touch()
+
+    def touch(self):
+        """Signaler que la place est toujours utilisée (si elle n'a pas été reprise)."""
+        if not self.lock.isOwned():
+            return
+        try:
+            os.utime(self.lock.path)
+        except OSError:
+            pass
+
+    def release(self):
+        self._released.set()
+        self.lock.release()
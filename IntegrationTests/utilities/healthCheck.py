@@ -0,0 +1,125 @@
+"""
+Vérification de l'environnement au démarrage de la session de tests.
+
+Les sondes sont lancées en parallèle avec un timeout court : si le backend
+est arrêté, la session s'interrompt en une seule fois au lieu de payer le
+timeout de chaque test (et de chaque cas paramétré).
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utilities.apiClient import ApiClient
+from utilities.readProperties import ReadConfig
+
+# scope : 'backend' (toute la suite en dépend) ou 'frontend' (tests UI seulement)
+ProbeResult = namedtuple('ProbeResult', 'name scope ok detail')
+
+
+def _probe(name, scope, check):
+    try:
+        detail = check()
+        return ProbeResult(name, scope, detail is None, detail)
+    except requests.exceptions.RequestException as e:
+        url = e.request.url if e.request is not None else ''
+        return ProbeResult(name, scope, False, f'{type(e).__name__} {url}'.strip())
+
+
+def runProbes(api_url, base_url, timeout=None):
+    """
+    Lancer les sondes en parallèle.
+
+    - backend joignable : toute réponse HTTP convient ;
+    - login admin : POST /api/auth/login renvoie un token ;
+    - base de données : GET /api/vehicles (lecture en base) renvoie 200 ;
+    - frontend joignable : GET baseURL renvoie 200.
+
+    Returns:
+        list[ProbeResult]: Le résultat de chaque sonde.
+    """
+    timeout = ReadConfig.getHealthCheckTimeout() if timeout is None else timeout
+    client = ApiClient(api_url, retries=0, timeout=timeout)
+    username, password = ReadConfig.getCredentials('admin')
+
+    def backendReachable():
+        client.get('/')
+
+    def adminLogin():
+        response = client.post('/api/auth/login', json={'username': username, 'password': password})
+        if response.status_code != 200 or not response.json().get('token'):
+            return f'HTTP {response.status_code} pour {username}'
+
+    def databaseQuery():
+        response = client.get('/api/vehicles')
+        if response.status_code != 200:
+            return f'GET /api/vehicles -> HTTP {response.status_code}'
+
+    def frontendReachable():
+        response = client.get(base_url)
+        if response.status_code != 200:
+            return f'GET {base_url} -> HTTP {response.status_code}'
+
+    probes = [
+        ('backend joignable', 'backend', backendReachable),
+        ('login admin', 'backend', adminLogin),
+        ('base de données', 'backend', databaseQuery),
+        ('frontend joignable', 'frontend', frontendReachable),
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            return list(executor.map(lambda probe: _probe(*probe), probes))
+    finally:
+        client.close()
+
+
+def describeFailures(results, scope):
+    """Message unique décrivant les sondes en échec d'une portée (None si tout va bien)."""
+    failures = [f'{result.name} ({result.detail})' for result in results
+                if result.scope == scope and not result.ok]
+    if not failures:
+        return None
+    return 'Environnement indisponible - ' + '; '.join(failures)
+
+
+class SmokeGate:
+    """
+    Porte des tests smoke : après l'échec d'un test smoke, les autres tests
+    sont ignorés. En parallèle, l'échec est partagé entre workers via un fichier.
+
+    En exécution série, les tests smoke passent en premier et conditionnent
+    tout le reste. Sous pytest -n N, la porte est seulement « au mieux » : le
+    tri ne fait qu'ordonner la file de chaque worker, et les autres workers
+    peuvent lancer des tests non smoke avant qu'un résultat smoke soit écrit.
+    Seuls les tests qui démarrent après l'échec sont ignorés. Pour une porte
+    stricte en CI, lancer d'abord `pytest -m smoke`, puis le reste.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: Fichier partagé entre workers (None en exécution série).
+        """
+        self.path = path
+        self.failure = None
+
+    def fail(self, reason):
+        self.failure = reason
+        if self.path:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(reason)
+
+    def check(self):
+        """Raison de l'échec smoke (de ce processus ou d'un autre worker), None sinon."""
+        if self.failure is None and self.path and os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                self.failure = f.read()
+        return self.failure
+
+    def cleanup(self):
+        if self.path:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
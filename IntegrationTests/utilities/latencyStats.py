@@ -0,0 +1,47 @@
+import math
+
+
+def percentile(sorted_values, p):
+    """
+    Calculer un percentile par interpolation linéaire.
+
+    Args:
+        sorted_values: Valeurs déjà triées par ordre croissant.
+        p: Percentile voulu, entre 0 et 100.
+
+    Returns:
+        float: La valeur du percentile, ou None si la liste est vide.
+    """
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * p / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    if low == high:
+        return sorted_values[int(rank)]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(samples_ms):
+    """
+    Résumer une série de latences (en millisecondes).
+
+    Args:
+        samples_ms: Latences mesurées, dans n'importe quel ordre.
+
+    Returns:
+        dict: count, min, mean, p50, p95, p99 et max (arrondis à 0,01 ms).
+    """
+    values = sorted(samples_ms)
+    if not values:
+        return {'count': 0}
+    summary = {
+        'count': len(values),
+        'min': values[0],
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': values[-1],
+    }
+    return {key: round(value, 2) if isinstance(value, float) else value
+            for key, value in summary.items()}
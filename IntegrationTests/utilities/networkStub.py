@@ -0,0 +1,162 @@
+import json
+import os
+import re
+
+# Script injecté avant tout autre script de chaque document (CDP
+# Page.addScriptToEvaluateOnNewDocument). Le HttpClient de Blazor WebAssembly
+# passe par window.fetch : le remplacer suffit pour enregistrer ou rejouer les
+# réponses du backend sans toucher aux fichiers de l'application (_framework...).
+_STUB_JS = '''
+(function (apiUrl, mode, strict, recordings) {
+    var originalFetch = window.fetch.bind(window);
+    var storageKey = '__networkRecordings';
+    var missesKey = '__networkMisses';
+
+    function keyOf(method, url) {
+        var parsed = new URL(url, window.location.href);
+        return method.toUpperCase() + ' ' + parsed.pathname + parsed.search;
+    }
+
+    function save(key, entry) {
+        var saved = JSON.parse(window.sessionStorage.getItem(storageKey) || '{}');
+        saved[key] = entry;
+        window.sessionStorage.setItem(storageKey, JSON.stringify(saved));
+    }
+
+    window.fetch = function (input, init) {
+        var url = typeof input === 'string' ? input : input.url;
+        if (url.indexOf(apiUrl) !== 0) {
+            return originalFetch(input, init);
+        }
+        var method = (init && init.method) || (input && input.method) || 'GET';
+        var key = keyOf(method, url);
+
+        if (mode === 'replay' && recordings[key]) {
+            var entry = recordings[key];
+            return Promise.resolve(new Response(entry.status === 204 ? null : entry.body,
+                {status: entry.status, headers: {'Content-Type': entry.contentType}}));
+        }
+        if (mode === 'replay' && strict) {
+            // Rejeu strict : une requête absente de l'enregistrement échoue
+            var misses = JSON.parse(window.sessionStorage.getItem(missesKey) || '[]');
+            misses.push(key);
+            window.sessionStorage.setItem(missesKey, JSON.stringify(misses));
+            return Promise.reject(new TypeError('Requete non enregistree: ' + key));
+        }
+        return originalFetch(input, init).then(function (response) {
+            if (mode === 'record') {
+                response.clone().text().then(function (body) {
+                    save(key, {status: response.status, body: body,
+                               contentType: response.headers.get('Content-Type') || 'application/json'});
+                });
+            }
+            return response;
+        });
+    };
+})(%s, %s, %s, %s);
+'''
+
+_READ_RECORDINGS_JS = "return window.sessionStorage.getItem('__networkRecordings');"
+_READ_MISSES_JS = "return window.sessionStorage.getItem('__networkMisses');"
+
+MODES = ('off', 'auto', 'record', 'replay')
+
+
+def fixturePath(fixtures_dir, test_id):
+    """Fichier de réponses enregistrées d'un test (identifiant pytest rendu sûr)."""
+    name = re.sub(r'[^A-Za-z0-9_.-]+', '_', test_id).strip('_')
+    return os.path.join(fixtures_dir, f'{name}.json')
+
+
+class NetworkStub:
+    """
+    Enregistrement / rejeu des réponses du backend dans un navigateur Chrome.
+
+    - record : les réponses de l'API sont capturées pendant un vrai passage
+      et écrites dans un fichier JSON par test (save()).
+    - replay : les requêtes sont servies depuis ce fichier, sans appel au
+      backend ; une requête absente de l'enregistrement échoue et fait
+      échouer le test (enregistrement périmé, voir misses()).
+    - auto : replay si le fichier existe, record sinon ; en replay auto, les
+      requêtes absentes de l'enregistrement partent vers le backend réel.
+
+    Nécessite le protocole DevTools (Chrome/Chromium en local).
+    """
+
+    def __init__(self, driver, api_url, path, mode='auto'):
+        """
+        Args:
+            driver: WebDriver Chrome/Chromium (execute_cdp_cmd)
+            api_url: URL de l'API dont les réponses sont enregistrées/rejouées
+            path: Fichier de réponses du test (voir fixturePath)
+            mode: 'auto', 'record' ou 'replay'
+        
+        Raises:
+            FileNotFoundError: En mode 'replay' si le fichier n'existe pas.
+        """
+        if mode not in MODES[1:]:
+            raise ValueError(f'Mode de stub réseau inconnu: {mode} (attendu: {", ".join(MODES)})')
+        if mode == 'replay' and not os.path.isfile(path):
+            raise FileNotFoundError(f'Aucun enregistrement à rejouer: {path} (lancer --network-stub=record)')
+        self.driver = driver
+        self.api_url = api_url.rstrip('/')
+        self.path = path
+        # Seul le mode replay explicite refuse les requêtes non enregistrées
+        self.strict = mode == 'replay'
+        if mode == 'auto':
+            mode = 'replay' if os.path.isfile(path) else 'record'
+        self.mode = mode
+        self._script_id = None
+
+    @staticmethod
+    def isSupported(driver):
+        return hasattr(driver, 'execute_cdp_cmd')
+
+    def start(self):
+        """Injecter le script avant la navigation du test (driver.get)."""
+        recordings = {}
+        if self.mode == 'replay':
+            with open(self.path, encoding='utf-8') as f:
+                recordings = json.load(f)
+        source = _STUB_JS % (json.dumps(self.api_url), json.dumps(self.mode),
+                             json.dumps(self.strict), json.dumps(recordings))
+        result = self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': source})
+        self._script_id = result['identifier']
+        return self
+
+    def save(self):
+        """
+        En mode record, écrire les réponses capturées (à appeler avant de
+        quitter l'origine du frontend : elles sont gardées dans son sessionStorage).
+
+        Returns:
+            int: Nombre de réponses enregistrées.
+        """
+        if self.mode != 'record':
+            return 0
+        recordings = json.loads(self.driver.execute_script(_READ_RECORDINGS_JS) or '{}')
+        if not recordings:
+            return 0
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(recordings, f, indent=2, sort_keys=True)
+        return len(recordings)
+
+    def misses(self):
+        """
+        En replay strict, les requêtes absentes de l'enregistrement (à appeler,
+        comme save(), avant de quitter l'origine du frontend).
+
+        Returns:
+            list[str]: Les requêtes ('GET /api/...') refusées.
+        """
+        if not self.strict:
+            return []
+        return json.loads(self.driver.execute_script(_READ_MISSES_JS) or '[]')
+
+    def stop(self):
+        """Retirer le script (le navigateur retourne au pool)."""
+        if self._script_id is not None:
+            self.driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument',
+                                        {'identifier': self._script_id})
+            self._script_id = None
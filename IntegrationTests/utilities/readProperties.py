@@ -93,16 +93,241 @@ class ReadConfig:
         """
         return config.get('credentials', 'customer_password')
 
+    @staticmethod
+    def getCredentials(role):
+        """
+        Obtenir les identifiants d'un rôle (admin, employee ou customer).
+        
+        Args:
+            role: Le nom du rôle tel qu'il apparaît dans la section [credentials].
+        
+        Returns:
+            tuple: (username, password)
+        """
+        role = role.lower()
+        return (config.get('credentials', f'{role}_username'),
+                config.get('credentials', f'{role}_password'))
+
+    @staticmethod
+    def getApiTimeout():
+        """
+        Obtenir le timeout par défaut des requêtes API.
+        
+        Returns:
+            float: Le timeout en secondes (5 par défaut).
+        """
+        return config.getfloat('api', 'timeout', fallback=5)
+
+    @staticmethod
+    def getApiPoolSize():
+        """
+        Obtenir le nombre de connexions HTTP gardées ouvertes par le client API.
+        
+        Returns:
+            int: La taille du pool de connexions (10 par défaut).
+        """
+        return config.getint('api', 'pool_size', fallback=10)
+
+    @staticmethod
+    def getApiConcurrency():
+        """
+        Obtenir le nombre maximal de requêtes simultanées du client API asynchrone.
+        
+        Returns:
+            int: Le nombre de requêtes en vol (50 par défaut).
+        """
+        return config.getint('api', 'concurrency', fallback=50)
+
+    @staticmethod
+    def getApiRetries():
+        """
+        Obtenir le nombre de nouvelles tentatives sur erreur de connexion.
+        
+        Returns:
+            int: Le nombre de tentatives (2 par défaut).
+        """
+        return config.getint('api', 'retries', fallback=2)
+
+    @staticmethod
+    def getApiBackoffFactor():
+        """
+        Obtenir le facteur de back-off entre deux tentatives.
+        
+        Returns:
+            float: Le facteur en secondes (0.2 par défaut).
+        """
+        return config.getfloat('api', 'backoff_factor', fallback=0.2)
+
+    @staticmethod
+    def getTokenCacheFile():
+        """
+        Obtenir le fichier de cache partagé des tokens JWT.
+        
+        Returns:
+            str: Le chemin du fichier, ou une chaîne vide pour le dossier temporaire.
+        """
+        return config.get('api', 'token_cache_file', fallback='')
+
+    @staticmethod
+    def getTokenRefreshMargin():
+        """
+        Obtenir la marge avant expiration à partir de laquelle un token est renouvelé.
+        
+        Returns:
+            int: La marge en secondes (60 par défaut).
+        """
+        return config.getint('api', 'token_refresh_margin', fallback=60)
+
+    @staticmethod
+    def getLoadUsers():
+        """
+        Obtenir le nombre d'utilisateurs virtuels des tests de charge.
+        
+        Returns:
+            int: Le nombre d'utilisateurs (10 par défaut).
+        """
+        return config.getint('load', 'users', fallback=10)
+
+    @staticmethod
+    def getLoadRampUp():
+        """
+        Obtenir la durée de montée en charge.
+        
+        Returns:
+            float: La durée en secondes (10 par défaut).
+        """
+        return config.getfloat('load', 'ramp_up', fallback=10)
+
+    @staticmethod
+    def getLoadDuration():
+        """
+        Obtenir la durée maximale d'un test de charge.
+        
+        Returns:
+            float: La durée en secondes (60 par défaut).
+        """
+        return config.getfloat('load', 'duration', fallback=60)
+
+    @staticmethod
+    def getLoadOutputDir():
+        """
+        Obtenir le répertoire des rapports de charge (JSON et HTML).
+        
+        Returns:
+            str: Le chemin du répertoire.
+        """
+        return config.get('load', 'output_dir', fallback='./Reports/load')
+
+    @staticmethod
+    def getBenchmarkIterations():
+        """
+        Obtenir le nombre de mesures par endpoint des benchmarks.
+        
+        Returns:
+            int: Le nombre d'itérations (50 par défaut).
+        """
+        return config.getint('benchmark', 'iterations', fallback=50)
+
+    @staticmethod
+    def getBenchmarkWarmup():
+        """
+        Obtenir le nombre de requêtes de chauffe (non mesurées) par endpoint.
+        
+        Returns:
+            int: Le nombre de requêtes de chauffe (5 par défaut).
+        """
+        return config.getint('benchmark', 'warmup', fallback=5)
+
+    @staticmethod
+    def getBenchmarkThreshold():
+        """
+        Obtenir la dégradation relative tolérée par rapport à la baseline.
+        
+        Returns:
+            float: Le seuil (0.25 = +25 % par défaut).
+        """
+        return config.getfloat('benchmark', 'regression_threshold', fallback=0.25)
+
+    @staticmethod
+    def getBenchmarkMinDelta():
+        """
+        Obtenir l'écart absolu minimal pour signaler une régression.
+        
+        Returns:
+            float: L'écart en millisecondes (5 par défaut).
+        """
+        return config.getfloat('benchmark', 'min_delta_ms', fallback=5)
+
+    @staticmethod
+    def getBenchmarkRequireBaselines():
+        """
+        Savoir si un benchmark sans baseline doit échouer (toujours en CI).
+        
+        Returns:
+            bool: True si la baseline est obligatoire (variable CI ou require_baselines).
+        """
+        return bool(os.environ.get('CI')) or config.getboolean('benchmark', 'require_baselines', fallback=False)
+
     @staticmethod
     def getBrowser():
         """
         Obtenir le type de navigateur.
         
         Returns:
-            str: Le type de navigateur.
+            str: Le type de navigateur (Chrome, Chromium, Firefox, suffixe -headless possible).
         """
         return config.get('selenium', 'browser')
 
+    @staticmethod
+    def getDriverCacheFile():
+        """
+        Obtenir le fichier de cache des chemins de pilotes (chromedriver, geckodriver).
+        
+        Returns:
+            str: Le chemin du fichier, ou une chaîne vide pour le dossier temporaire.
+        """
+        return config.get('selenium', 'driver_cache_file', fallback='')
+
+    @staticmethod
+    def getRemoteUrl():
+        """
+        Obtenir l'URL de la grille Selenium (ou d'un WebDriver distant).
+        
+        Returns:
+            str: L'URL, ou une chaîne vide pour lancer les navigateurs en local.
+        """
+        return config.get('selenium', 'remote_url', fallback='')
+
+    @staticmethod
+    def getRemoteMaxSessions():
+        """
+        Obtenir le nombre maximal de sessions ouvertes en même temps sur la grille.
+        
+        Returns:
+            int: Le nombre de sessions (4 par défaut).
+        """
+        return config.getint('selenium', 'remote_max_sessions', fallback=4)
+
+    @staticmethod
+    def getRemoteQueueTimeout():
+        """
+        Obtenir l'attente maximale d'une session distante (place libre puis création).
+        
+        Returns:
+            int: Le délai en secondes (120 par défaut).
+        """
+        return config.getint('selenium', 'remote_queue_timeout', fallback=120)
+
+    @staticmethod
+    def getRemoteSlotDir():
+        """
+        Obtenir le dossier des verrous limitant les sessions distantes.
+        
+        Returns:
+            str: Le chemin du dossier, ou une chaîne vide pour le dossier temporaire.
+        """
+        return config.get('selenium', 'remote_slot_dir', fallback='')
+
     @staticmethod
     def getImplicitWait():
         """
@@ -113,6 +338,211 @@ class ReadConfig:
         """
         return int(config.get('selenium', 'implicit_wait'))
 
+    @staticmethod
+    def getExplicitWait():
+        """
+        Obtenir le délai maximal des attentes explicites (pages/waits.py).
+        
+        Returns:
+            int: Le délai en secondes (10 par défaut).
+        """
+        return config.getint('selenium', 'explicit_wait', fallback=10)
+
+    @staticmethod
+    def getDriverPoolSize():
+        """
+        Obtenir le nombre de navigateurs gardés en réserve dans le pool.
+        
+        Returns:
+            int: La taille du pool (1 par défaut).
+        """
+        return config.getint('selenium', 'pool_size', fallback=1)
+
+    @staticmethod
+    def getHeadless():
+        """
+        Savoir si le navigateur démarre sans fenêtre (option --headed pour déboguer).
+        
+        Returns:
+            bool: True pour le mode headless (False par défaut).
+        """
+        return config.getboolean('selenium', 'headless', fallback=False)
+
+    @staticmethod
+    def getLightweightProfile():
+        """
+        Savoir si le profil allégé est utilisé (sans images, extensions ni trafic en arrière-plan).
+        
+        Returns:
+            bool: True pour le profil allégé (False par défaut).
+        """
+        return config.getboolean('selenium', 'lightweight', fallback=False)
+
+    @staticmethod
+    def getWindowSize():
+        """
+        Obtenir la taille de la fenêtre du navigateur.
+        
+        Returns:
+            tuple: (largeur, hauteur), (1920, 1080) par défaut.
+        """
+        width, height = config.get('selenium', 'window_size', fallback='1920,1080').split(',')
+        return int(width), int(height)
+
+    @staticmethod
+    def getPageLoadStrategy():
+        """
+        Obtenir la stratégie de chargement des pages ('normal', 'eager' ou 'none').
+        
+        Returns:
+            str: La stratégie ('normal' par défaut).
+        """
+        return config.get('selenium', 'page_load_strategy', fallback='normal')
+
+    @staticmethod
+    def getNetworkStubMode():
+        """
+        Obtenir le mode d'enregistrement/rejeu des réponses du backend (tests marqués stub_backend).
+        
+        Returns:
+            str: 'off', 'auto', 'record' ou 'replay' ('off' par défaut).
+        """
+        return config.get('selenium', 'network_stub', fallback='off')
+
+    @staticmethod
+    def getNetworkFixturesDir():
+        """
+        Obtenir le dossier des réponses enregistrées du backend.
+        
+        Returns:
+            str: Le chemin du dossier.
+        """
+        return config.get('selenium', 'network_fixtures_dir', fallback='./Fixtures/network')
+
+    @staticmethod
+    def getImpactMapFile():
+        """
+        Obtenir le fichier de la carte tests -> endpoints/pages (sélection des tests impactés).
+        
+        Returns:
+            str: Le chemin du fichier JSON.
+        """
+        return config.get('impact', 'map_file', fallback='./Reports/test_impact.json')
+
+    @staticmethod
+    def getDurationsFile():
+        """
+        Obtenir le fichier de l'historique des durées des tests.
+        
+        Returns:
+            str: Le chemin du fichier JSON.
+        """
+        return config.get('scheduling', 'durations_file', fallback='./Reports/test_durations.json')
+
+    @staticmethod
+    def getSlowestFirst():
+        """
+        Savoir si les tests historiquement les plus lents sont exécutés en premier.
+        
+        Returns:
+            bool: True pour trier par durée décroissante (False par défaut).
+        """
+        return config.getboolean('scheduling', 'slowest_first', fallback=False)
+
+    @staticmethod
+    def getDefaultDuration(kind):
+        """
+        Obtenir la durée supposée d'un test sans historique.
+        
+        Args:
+            kind: 'ui' ou 'api'.
+        
+        Returns:
+            float: La durée en secondes (5 pour l'UI, 0.5 pour l'API par défaut).
+        """
+        return config.getfloat('scheduling', f'default_duration_{kind}',
+                               fallback=5.0 if kind == 'ui' else 0.5)
+
+    @staticmethod
+    def getHealthCheck():
+        """
+        Savoir si l'environnement (backend, login, base, frontend) est vérifié au démarrage.
+        
+        Returns:
+            bool: True si la vérification est active (True par défaut).
+        """
+        return config.getboolean('smoke', 'health_check', fallback=True)
+
+    @staticmethod
+    def getHealthCheckTimeout():
+        """
+        Obtenir le timeout des sondes de démarrage.
+        
+        Returns:
+            float: Le délai en secondes (3 par défaut).
+        """
+        return config.getfloat('smoke', 'timeout', fallback=3.0)
+
+    @staticmethod
+    def getDatabaseFile():
+        """
+        Obtenir le fichier de la base du Backend à restaurer entre les modules.
+        
+        Returns:
+            str: Le chemin de la base, None si l'instantané est désactivé.
+        """
+        return config.get('database', 'db_file', fallback='').strip() or None
+
+    @staticmethod
+    def getAsyncLogging():
+        """
+        Savoir si LogGen écrit les logs via une file et un thread d'écoute.
+        
+        Returns:
+            bool: True pour le mode asynchrone (False par défaut).
+        """
+        return config.getboolean('logging', 'async', fallback=False)
+
+    @staticmethod
+    def getLogBatchSize():
+        """
+        Obtenir le nombre de messages écrits par lot en mode asynchrone.
+        
+        Returns:
+            int: La taille des lots (100 par défaut).
+        """
+        return config.getint('logging', 'batch_size', fallback=100)
+
+    @staticmethod
+    def getLogFlushInterval():
+        """
+        Obtenir le délai maximal avant écriture d'un lot incomplet.
+        
+        Returns:
+            float: Le délai en secondes (1 par défaut).
+        """
+        return config.getfloat('logging', 'flush_interval', fallback=1.0)
+
+    @staticmethod
+    def getTelemetryEnabled():
+        """
+        Savoir si les événements JSONL (Logs/telemetry.jsonl) sont émis.
+        
+        Returns:
+            bool: True si la télémétrie est active (False par défaut).
+        """
+        return config.getboolean('logging', 'telemetry', fallback=False)
+
+    @staticmethod
+    def getProfileCommands():
+        """
+        Savoir si chaque commande WebDriver doit être profilée (équivaut à --profile-webdriver).
+        
+        Returns:
+            bool: True si le profilage est actif (False par défaut).
+        """
+        return config.getboolean('selenium', 'profile_commands', fallback=False)
+
     @staticmethod
     def getScreenshotsDir():
         """
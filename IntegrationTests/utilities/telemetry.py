@@ -0,0 +1,102 @@
+import functools
+import time
+from contextlib import contextmanager
+
+from utilities.customLogger import LogGen
+from utilities.readProperties import ReadConfig
+
+# Identifiant pytest du test en cours (positionné par conftest.py)
+_current = {'test_id': None}
+
+
+def setCurrentTest(test_id):
+    """Positionner le test courant auquel rattacher les événements."""
+    _current['test_id'] = test_id
+
+
+def getCurrentTest():
+    return _current['test_id']
+
+
+def isEnabled():
+    return ReadConfig.getTelemetryEnabled()
+
+
+def attachCommandCounter(driver):
+    """
+    Compter les commandes WebDriver envoyées par un navigateur.
+    Chaque commande (find_element, click, get...) passe par driver.execute().
+    """
+    if hasattr(driver, 'command_count'):
+        return driver
+    driver.command_count = 0
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def countingExecute(driver_command, params=None):
+        driver.command_count += 1
+        return execute(driver_command, params)
+
+    driver.execute = countingExecute
+    return driver
+
+
+def commandCount(driver):
+    """Nombre de commandes WebDriver envoyées jusqu'ici (0 si non instrumenté)."""
+    return getattr(driver, 'command_count', 0)
+
+
+def emit(event_type, name, started, ended, outcome, commands=None, **fields):
+    """Écrire un événement JSONL via LogGen."""
+    event = {
+        'type': event_type,
+        'test_id': getCurrentTest(),
+        'name': name,
+        'start': round(started, 6),
+        'end': round(ended, 6),
+        'duration_ms': round((ended - started) * 1000, 3),
+        'commands': commands,
+        'outcome': outcome,
+    }
+    event.update(fields)
+    LogGen.log_event(event)
+
+
+@contextmanager
+def step(name, driver=None, kind='action'):
+    """
+    Chronométrer une étape de test et émettre un événement 'step'.
+
+    Args:
+        name: Nom de l'étape (ex: 'LoginPage.clickLogin').
+        driver: Navigateur dont on compte les commandes.
+        kind: 'action' (interaction) ou 'wait' (attente d'une condition).
+    """
+    if not isEnabled():
+        yield
+        return
+    started = time.time()
+    commands_before = commandCount(driver)
+    outcome = 'passed'
+    try:
+        yield
+    except BaseException:
+        outcome = 'failed'
+        raise
+    finally:
+        emit('step', name, started, time.time(), outcome,
+             commands=commandCount(driver) - commands_before, kind=kind)
+
+
+def timedStep(kind='action'):
+    """
+    Décorateur de méthode de Page Object : chaque appel devient une étape
+    nommée 'Classe.methode', chronométrée sur self.driver.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with step(f'{type(self).__name__}.{method.__name__}', self.driver, kind):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,111 @@
+"""
+Agrégation des événements de télémétrie (Logs/telemetry*.jsonl).
+
+Usage (depuis le dossier IntegrationTests) :
+    python -m utilities.telemetryReport [--logs-dir ./Logs] [--top 10] [--json]
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from collections import defaultdict
+
+
+def loadEvents(logs_dir):
+    """Lire les événements de tous les fichiers telemetry*.jsonl (workers compris)."""
+    events = []
+    for path in sorted(glob.glob(os.path.join(logs_dir, 'telemetry*.jsonl'))):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    continue
+    return events
+
+
+def aggregate(events, top=10):
+    """
+    Calculer les étapes et tests les plus lents et la répartition attente/action.
+
+    Returns:
+        dict: slowest_steps, slowest_tests, time_by_kind (ms)
+    """
+    steps = defaultdict(lambda: {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'commands': 0, 'kind': None})
+    time_by_kind = defaultdict(float)
+    tests = []
+    for event in events:
+        if event.get('type') == 'step':
+            stats = steps[event['name']]
+            stats['count'] += 1
+            stats['total_ms'] += event['duration_ms']
+            stats['max_ms'] = max(stats['max_ms'], event['duration_ms'])
+            stats['commands'] += event.get('commands') or 0
+            stats['kind'] = event.get('kind', 'action')
+            time_by_kind[stats['kind']] += event['duration_ms']
+        elif event.get('type') == 'test':
+            tests.append(event)
+
+    slowest_steps = []
+    for name, stats in steps.items():
+        slowest_steps.append({
+            'name': name,
+            'kind': stats['kind'],
+            'count': stats['count'],
+            'total_ms': round(stats['total_ms'], 1),
+            'mean_ms': round(stats['total_ms'] / stats['count'], 1),
+            'max_ms': round(stats['max_ms'], 1),
+            'commands': stats['commands'],
+        })
+    slowest_steps.sort(key=lambda s: s['total_ms'], reverse=True)
+
+    slowest_tests = sorted(tests, key=lambda t: t['duration_ms'], reverse=True)
+    return {
+        'slowest_steps': slowest_steps[:top],
+        'slowest_tests': [{'test_id': t['test_id'], 'duration_ms': t['duration_ms'],
+                           'commands': t.get('commands'), 'outcome': t['outcome']}
+                          for t in slowest_tests[:top]],
+        'time_by_kind': {kind: round(ms, 1) for kind, ms in sorted(time_by_kind.items())},
+    }
+
+
+def printReport(report):
+    print('Etapes les plus lentes (temps cumule):')
+    for s in report['slowest_steps']:
+        print(f"  {s['total_ms']:>10.1f} ms  {s['count']:>4}x  moy {s['mean_ms']:>8.1f} ms  "
+              f"max {s['max_ms']:>8.1f} ms  {s['commands']:>5} cmd  [{s['kind']}] {s['name']}")
+    print('\nTests les plus lents:')
+    for t in report['slowest_tests']:
+        print(f"  {t['duration_ms']:>10.1f} ms  {t['commands'] or 0:>5} cmd  {t['outcome']:<7} {t['test_id']}")
+    print('\nTemps par type d\'etape:')
+    total = sum(report['time_by_kind'].values()) or 1
+    for kind, ms in report['time_by_kind'].items():
+        print(f"  {kind:<7} {ms:>10.1f} ms ({ms * 100 / total:.0f} %)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m utilities.telemetryReport',
+                                     description='Analyse des evenements de telemetrie des tests')
+    parser.add_argument('--logs-dir', default='./Logs')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--json', action='store_true', help='Sortie JSON au lieu du texte')
+    args = parser.parse_args(argv)
+
+    events = loadEvents(args.logs_dir)
+    if not events:
+        print(f'Aucun evenement dans {args.logs_dir}/telemetry*.jsonl')
+        return 1
+    report = aggregate(events, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        printReport(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
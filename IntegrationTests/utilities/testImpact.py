@@ -0,0 +1,234 @@
+"""
+Sélection des tests impactés par un changement (test-impact analysis).
+
+Pendant chaque exécution, on enregistre pour chaque test :
+- ses markers de domaine (vehicles, auth, rentals...),
+- les endpoints appelés via ApiClient (/api/vehicles/{id}...),
+- les pages du frontend ouvertes par le navigateur (/vehicles/browse...).
+Cette carte est fusionnée dans un fichier JSON après chaque exécution.
+
+Avec pytest --impacted-by=<ref git>, seuls les tests touchés par
+`git diff <ref>` sont exécutés (voir selectImpacted pour les règles).
+"""
+import functools
+import json
+import os
+import re
+import subprocess
+from urllib.parse import urlsplit
+
+from utilities.fileLock import FileLock
+from utilities.readProperties import ReadConfig
+
+# Markers qui ne désignent pas un domaine fonctionnel
+GENERIC_MARKERS = {
+    'api', 'ui', 'smoke', 'regression', 'slow', 'integration', 'benchmark', 'stub_backend',
+    'parametrize', 'skip', 'skipif', 'xfail', 'usefixtures', 'filterwarnings', 'datafile',
+}
+
+# Dossiers du dépôt dont les changements sont analysés
+BACKEND_DIR = 'Backend/'
+FRONTEND_DIR = 'Frontend/'
+TESTS_DIR = 'IntegrationTests/'
+
+_ID_SEGMENT = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F-]{27})$')
+
+# Enregistrement du test en cours (un seul test à la fois par processus)
+_current = {'test_id': None, 'endpoints': set(), 'pages': set()}
+_results = {}
+
+
+def normalizePath(url):
+    """
+    Réduire une URL à un gabarit de chemin : '/api/vehicles/12?x=1' -> '/api/vehicles/{id}'.
+    """
+    path = urlsplit(url).path.rstrip('/') or '/'
+    segments = ['{id}' if _ID_SEGMENT.match(segment) else segment.lower()
+                for segment in path.split('/')]
+    return '/'.join(segments)
+
+
+def startTest(test_id):
+    _current['test_id'] = test_id
+    _current['endpoints'] = set()
+    _current['pages'] = set()
+
+
+def recordEndpoint(method, url):
+    """Appelé par ApiClient pour chaque requête du test en cours."""
+    if _current['test_id'] is not None:
+        _current['endpoints'].add(f'{method.upper()} {normalizePath(url)}')
+
+
+def recordPage(url):
+    """Appelé à chaque navigation du navigateur (driver.get)."""
+    if _current['test_id'] is not None and url.startswith('http'):
+        _current['pages'].add(normalizePath(url))
+
+
+def finishTest(markers, file, executed=True):
+    """
+    Clore l'enregistrement du test en cours.
+
+    Args:
+        markers: Noms des markers du test.
+        file: Fichier du test (relatif à IntegrationTests).
+        executed: False pour un test ignoré (son entrée existante est conservée).
+    """
+    test_id = _current['test_id']
+    _current['test_id'] = None
+    if test_id is None or not executed:
+        return
+    _results[test_id] = {
+        'file': file,
+        'markers': sorted(set(markers) - GENERIC_MARKERS),
+        'endpoints': sorted(_current['endpoints']),
+        'pages': sorted(_current['pages']),
+    }
+
+
+def attachPageRecorder(driver):
+    """Enregistrer les pages ouvertes par un navigateur (commande WebDriver 'get')."""
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def recordingExecute(driver_command, params=None):
+        if driver_command == 'get' and params:
+            recordPage(params.get('url', ''))
+        return execute(driver_command, params)
+
+    driver.execute = recordingExecute
+    return driver
+
+
+# ---------------------------------------------------------------------------
+# Carte persistée
+# ---------------------------------------------------------------------------
+
+def loadMap(map_file=None):
+    map_file = map_file or ReadConfig.getImpactMapFile()
+    try:
+        with open(map_file, encoding='utf-8') as f:
+            return json.load(f).get('tests', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def saveMap(map_file=None):
+    """
+    Fusionner les tests enregistrés pendant cette exécution dans la carte
+    (mise à jour incrémentale, sûre entre workers parallèles).
+    """
+    if not _results:
+        return
+    map_file = map_file or ReadConfig.getImpactMapFile()
+    os.makedirs(os.path.dirname(map_file) or '.', exist_ok=True)
+    with FileLock(map_file + '.lock'):
+        tests = loadMap(map_file)
+        tests.update(_results)
+        tmp_file = f'{map_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'tests': tests}, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, map_file)
+    _results.clear()
+
+
+# ---------------------------------------------------------------------------
+# Sélection
+# ---------------------------------------------------------------------------
+
+def changedFiles(ref, repo_root):
+    """
+    Fichiers modifiés entre `ref` et l'arbre de travail, y compris les nouveaux
+    fichiers pas encore ajoutés à git (chemins relatifs au dépôt).
+    """
+    def git(*args):
+        output = subprocess.run(['git', *args], cwd=repo_root,
+                                capture_output=True, text=True, check=True).stdout
+        return [line.strip() for line in output.splitlines() if line.strip()]
+
+    changed = git('diff', '--name-only', ref)
+    untracked = git('ls-files', '--others', '--exclude-standard', '--full-name', ':/')
+    return list(dict.fromkeys(changed + untracked))
+
+
+def repoRoot(start_dir):
+    return subprocess.run(['git', 'rev-parse', '--show-toplevel'], cwd=start_dir,
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+def controllerPrefix(path):
+    """'Backend/Controllers/VehicleDamagesController.cs' -> '/api/vehicledamages'."""
+    name = os.path.basename(path)
+    if not name.endswith('Controller.cs'):
+        return None
+    return '/api/' + name[:-len('Controller.cs')].lower()
+
+
+def pageRoutes(path, repo_root):
+    """Routes @page d'un composant Razor, sous forme d'expressions régulières."""
+    routes = []
+    try:
+        with open(os.path.join(repo_root, path), encoding='utf-8-sig') as f:
+            for line in f:
+                match = re.match(r'\s*@page\s+"([^"]+)"', line)
+                if match:
+                    pattern = re.sub(r'\{[^}]+\}', '[^/]+', match.group(1).rstrip('/').lower() or '/')
+                    routes.append(re.compile(f'^{pattern}$'))
+    except OSError:
+        pass
+    return routes
+
+
+def _matchesDomain(markers, path):
+    name = os.path.splitext(os.path.basename(path))[0].lower()
+    return any(marker.rstrip('s') in name for marker in markers)
+
+
+def selectImpacted(test_ids, tests_map, changed, repo_root):
+    """
+    Choisir les tests à exécuter.
+
+    Règles (conservatrices) :
+    - test absent de la carte (nouveau) : exécuté ;
+    - fichier de test modifié : ses tests ;
+    - autre fichier de IntegrationTests/ (conftest, pages, utilities...) : tous ;
+    - contrôleur Backend : tests appelant ses endpoints ou de même domaine ;
+    - page Razor : tests ouvrant une de ses routes ou de même domaine ;
+    - autre fichier Backend/Frontend : tests de même domaine (marker contenu
+      dans le nom du fichier), tous si aucun domaine ne correspond ;
+    - fichiers hors de ces dossiers (documentation...) : ignorés.
+
+    Returns:
+        set: Identifiants des tests à exécuter.
+    """
+    selected = {test_id for test_id in test_ids if test_id not in tests_map}
+    known = [test_id for test_id in test_ids if test_id in tests_map]
+    all_markers = {marker for entry in tests_map.values() for marker in entry['markers']}
+
+    for path in changed:
+        if path.startswith(TESTS_DIR):
+            relative = path[len(TESTS_DIR):]
+            if relative.startswith('tests/test_'):
+                selected.update(t for t in known if tests_map[t]['file'] == relative)
+                continue
+            if relative.endswith(('.py', '.ini')):
+                return set(test_ids)
+            continue
+        if not path.startswith((BACKEND_DIR, FRONTEND_DIR)):
+            continue
+
+        prefix = controllerPrefix(path) if path.startswith(BACKEND_DIR) else None
+        routes = pageRoutes(path, repo_root) if path.endswith('.razor') else []
+        if prefix is None and not routes and not _matchesDomain(all_markers, path):
+            # Code partagé (Program.cs, DbContext, layout...) : tout relancer
+            return set(test_ids)
+
+        for test_id in known:
+            entry = tests_map[test_id]
+            endpoints = [endpoint.split(' ', 1)[1] for endpoint in entry['endpoints']]
+            if _matchesDomain(entry['markers'], path) \
+                    or (prefix and any(e == prefix or e.startswith(prefix + '/') for e in endpoints)) \
+                    or any(route.match(page) for route in routes for page in entry['pages']):
+                selected.add(test_id)
+    return selected
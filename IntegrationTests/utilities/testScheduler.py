@@ -0,0 +1,124 @@
+"""
+Ordonnancement des tests selon leur durée historique.
+
+- Les durées (setup + appel + teardown) sont enregistrées à chaque exécution
+  dans un fichier JSON (moyenne glissante, fusion sûre entre workers).
+- Les tests historiquement les plus lents passent en premier : avec
+  pytest -n N, aucun worker ne finit la session seul sur un long test UI.
+  L'ordre reste groupé par module puis par classe (modules et classes triés
+  par durée totale) : les fixtures de portée module/classe ne sont pas
+  détruites et recréées à chaque changement de module.
+- Avec --shard-count/--shard-id, les tests sont répartis entre les machines
+  de CI par LPT (longest processing time first) pour équilibrer le temps
+  total de chaque shard. --shard-kind=ui|api garde les tests UI sur les
+  agents avec navigateur et les tests API sur des agents légers.
+"""
+import json
+import os
+from collections import defaultdict
+
+from utilities.fileLock import FileLock
+from utilities.readProperties import ReadConfig
+
+KINDS = ('all', 'ui', 'api')
+
+# Poids de la dernière mesure dans la moyenne glissante
+SMOOTHING = 0.5
+
+_measured = {}
+
+
+def recordDuration(test_id, seconds):
+    """Mémoriser la durée d'un test de cette exécution (écrite par saveDurations)."""
+    _measured[test_id] = round(seconds, 4)
+
+
+def loadDurations(durations_file=None):
+    durations_file = durations_file or ReadConfig.getDurationsFile()
+    try:
+        with open(durations_file, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def saveDurations(durations_file=None):
+    """Fusionner les durées mesurées dans le fichier d'historique."""
+    if not _measured:
+        return
+    durations_file = durations_file or ReadConfig.getDurationsFile()
+    os.makedirs(os.path.dirname(durations_file) or '.', exist_ok=True)
+    with FileLock(durations_file + '.lock'):
+        durations = loadDurations(durations_file)
+        for test_id, seconds in _measured.items():
+            previous = durations.get(test_id)
+            durations[test_id] = seconds if previous is None else round(
+                SMOOTHING * seconds + (1 - SMOOTHING) * previous, 4)
+        tmp_file = f'{durations_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, durations_file)
+    _measured.clear()
+
+
+def estimate(test_id, kind, durations):
+    """Durée attendue d'un test (valeur par défaut de son type s'il est nouveau)."""
+    if test_id in durations:
+        return durations[test_id]
+    return ReadConfig.getDefaultDuration(kind)
+
+
+def _group(test_id):
+    """(module, classe) d'un identifiant pytest ('tests/test_x.py::Classe::test_y[p]')."""
+    parts = test_id.split('::')
+    return parts[0], '::'.join(parts[1:-1])
+
+
+def slowestFirst(tests, durations):
+    """
+    Trier les tests du plus lent au plus rapide sans mélanger les modules ni
+    les classes : modules par durée totale, puis classes par durée totale,
+    puis tests. L'ordre est stable et identique sur tous les workers
+    (l'identifiant départage les égalités).
+
+    Args:
+        tests: Liste de (identifiant, type) ; type 'ui' ou 'api'.
+
+    Returns:
+        list: Les identifiants triés.
+    """
+    module_totals = defaultdict(float)
+    class_totals = defaultdict(float)
+    for test_id, kind in tests:
+        module, cls = _group(test_id)
+        seconds = estimate(test_id, kind, durations)
+        module_totals[module] += seconds
+        class_totals[module, cls] += seconds
+
+    def key(test):
+        test_id, kind = test
+        module, cls = _group(test_id)
+        return (-module_totals[module], module, -class_totals[module, cls], cls,
+                -estimate(test_id, kind, durations), test_id)
+
+    return [test_id for test_id, kind in sorted(tests, key=key)]
+
+
+def assignShards(tests, durations, shard_count):
+    """
+    Répartir les tests sur `shard_count` shards par LPT : chaque test, du plus
+    long au plus court, va au shard le moins chargé.
+
+    Returns:
+        list[list]: Identifiants de chaque shard.
+    """
+    shards = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+    kinds = dict(tests)
+    # LPT : tri global par durée (l'ordre d'exécution est refait par slowestFirst)
+    ordered = sorted(kinds, key=lambda test_id: (-estimate(test_id, kinds[test_id], durations), test_id))
+    for test_id in ordered:
+        index = loads.index(min(loads))
+        shards[index].append(test_id)
+        loads[index] += estimate(test_id, kinds[test_id], durations)
+    return shards
@@ -0,0 +1,185 @@
+import base64
+import getpass
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+
+import requests
+
+from utilities import testImpact
+from utilities.apiClient import ApiClient
+from utilities.fileLock import FileLock
+from utilities.readProperties import ReadConfig
+
+
+def decodeJwtExpiry(token):
+    """
+    Lire le claim `exp` d'un JWT (sans vérifier la signature).
+
+    Args:
+        token: Le JWT renvoyé par /api/auth/login.
+
+    Returns:
+        float: L'expiration en secondes epoch, ou None si illisible.
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def privateCacheDir():
+    """
+    Dossier de cache propre à l'utilisateur courant (droits 0700), dans le
+    dossier temporaire : les tokens admin ne sont pas lisibles par les autres
+    comptes d'un agent de CI partagé.
+
+    Raises:
+        PermissionError: Si le dossier existe mais appartient à un autre
+            utilisateur ou est accessible aux autres (pré-créé par un tiers).
+    """
+    owner = str(os.getuid()) if hasattr(os, 'getuid') else getpass.getuser()
+    path = os.path.join(tempfile.gettempdir(), f'carrental-integration-{owner}')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if hasattr(os, 'getuid'):
+        info = os.lstat(path)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise PermissionError(f'Dossier de cache des tokens non sûr: {path}')
+    return path
+
+
+class TokenProvider:
+    """
+    Fournisseur de tokens JWT mis en cache par rôle (admin, employee, customer).
+
+    Un token est réutilisé jusqu'à peu avant son expiration puis renouvelé
+    automatiquement. Le cache est aussi écrit sur disque (fichier 0600 dans un
+    dossier propre à l'utilisateur), protégé par un verrou fichier, pour que
+    les workers parallèles partagent le même login.
+    """
+
+    def __init__(self, api_url, cache_file=None, refresh_margin=None, client=None):
+        """
+        Args:
+            api_url: URL de base de l'API backend.
+            cache_file: Fichier de cache partagé (privateCacheDir() par défaut).
+            refresh_margin: Secondes avant expiration à partir desquelles on renouvelle.
+            client: ApiClient à utiliser pour le login (un nouveau client sinon).
+        """
+        self.api_url = api_url
+        self.client = client or ApiClient(api_url)
+        self.cache_file = cache_file or ReadConfig.getTokenCacheFile() or os.path.join(
+            privateCacheDir(), 'tokens.json')
+        self.refresh_margin = ReadConfig.getTokenRefreshMargin() if refresh_margin is None else refresh_margin
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def getToken(self, role='admin'):
+        """
+        Obtenir un token valide pour le rôle demandé.
+
+        Args:
+            role: 'admin', 'employee' ou 'customer' (identifiants de config.ini).
+
+        Returns:
+            str: Le JWT, ou None si la connexion a échoué.
+        """
+        session = self.getSession(role)
+        return session['token'] if session else None
+
+    def getSession(self, role='admin'):
+        """
+        Obtenir la session complète renvoyée par le login (mise en cache comme le token).
+
+        Args:
+            role: 'admin', 'employee' ou 'customer' (identifiants de config.ini).
+
+        Returns:
+            dict: token, username, role (tel que renvoyé par l'API) et expires_at,
+            ou None si la connexion a échoué.
+        """
+        # Même servi depuis le cache, le test dépend du login
+        testImpact.recordEndpoint('POST', '/api/auth/login')
+        with self._lock:
+            entry = self._memory.get(role)
+            if self._isFresh(entry):
+                return entry
+
+            with FileLock(self.cache_file + '.lock'):
+                cache = self._readCache()
+                entry = cache.get(self._cacheKey(role))
+                if not self._isFresh(entry):
+                    entry = self._login(role)
+                    if entry is None:
+                        return None
+                    cache[self._cacheKey(role)] = entry
+                    self._writeCache(cache)
+
+            self._memory[role] = entry
+            return entry
+
+    def invalidate(self, role=None):
+        """Oublier le token d'un rôle (ou de tous) pour forcer un nouveau login."""
+        with self._lock, FileLock(self.cache_file + '.lock'):
+            if role is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(role, None)
+
+            prefix = self._cacheKey(role) if role else f'{self.api_url}|'
+            cache = {key: entry for key, entry in self._readCache().items()
+                     if not key.startswith(prefix)}
+            self._writeCache(cache)
+
+    def _cacheKey(self, role):
+        """Clé de cache : un même fichier peut servir plusieurs backends."""
+        return f'{self.api_url}|{role}'
+
+    def _isFresh(self, entry):
+        # Les entrées sans username/role (ancien format du cache) sont renouvelées
+        return (bool(entry) and 'role' in entry
+                and entry['expires_at'] - self.refresh_margin > time.time())
+
+    def _login(self, role):
+        """Effectuer POST /api/auth/login avec les identifiants du rôle."""
+        username, password = ReadConfig.getCredentials(role)
+        try:
+            response = self.client.post('/api/auth/login',
+                                        json={'username': username, 'password': password})
+        except requests.exceptions.RequestException as e:
+            print(f'Erreur lors de l\'obtention du token ({role}): {e}')
+            return None
+        if response.status_code != 200:
+            return None
+
+        data = response.json()
+        token = data.get('token')
+        if not token:
+            return None
+        # Sans claim exp lisible, garder le token pour la durée de la session
+        expires_at = decodeJwtExpiry(token) or time.time() + 3600
+        return {'token': token, 'expires_at': expires_at,
+                'username': data.get('username') or username, 'role': data.get('role')}
+
+    def _readCache(self):
+        try:
+            with open(self.cache_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _writeCache(self, cache):
+        tmp_file = f'{self.cache_file}.{os.getpid()}.tmp'
+        # Lisible par le seul propriétaire (les tokens donnent un accès admin)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, self.cache_file)
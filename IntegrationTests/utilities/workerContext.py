@@ -0,0 +1,125 @@
+import glob
+import heapq
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+# Format des horodatages écrits par LogGen (utilisé pour fusionner les logs)
+LOG_DATE_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+# Répertoires de profils Chrome créés par ce processus
+_profile_dirs = []
+
+
+def getWorkerId():
+    """
+    Obtenir l'identifiant du worker courant en exécution parallèle (pytest-xdist).
+
+    Returns:
+        str: 'gw0', 'gw1', ... en parallèle, 'main' en exécution série.
+    """
+    return os.environ.get('PYTEST_XDIST_WORKER', 'main')
+
+
+def isParallelWorker():
+    """Vérifier si le processus courant est un worker pytest-xdist."""
+    return getWorkerId() != 'main'
+
+
+def getWorkerLogFile(log_file):
+    """
+    Adapter un chemin de log pour qu'il soit propre au worker courant.
+
+    Exemple: ./Logs/automation.log -> ./Logs/automation.gw1.log
+
+    Args:
+        log_file: Chemin du fichier de log partagé.
+
+    Returns:
+        str: Le chemin inchangé en série, suffixé par le worker en parallèle.
+    """
+    if not isParallelWorker():
+        return log_file
+    root, ext = os.path.splitext(log_file)
+    return f'{root}.{getWorkerId()}{ext or ".log"}'
+
+
+def getScreenshotPath(name, screenshots_dir='./Screenshots'):
+    """
+    Construire un chemin de capture d'écran unique (worker + horodatage).
+
+    Args:
+        name: Nom logique de la capture (ex: 'test_login').
+        screenshots_dir: Répertoire de destination.
+
+    Returns:
+        str: Chemin du fichier .png à écrire.
+    """
+    os.makedirs(screenshots_dir, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+    suffix = f'_{getWorkerId()}' if isParallelWorker() else ''
+    return os.path.join(screenshots_dir, f'{name}{suffix}_{timestamp}.png')
+
+
+def createChromeProfileDir():
+    """
+    Créer un répertoire de profil Chrome dédié (un par navigateur).
+    Deux instances de Chrome ne peuvent pas partager le même profil.
+
+    Returns:
+        str: Chemin du répertoire temporaire créé.
+    """
+    profile_dir = tempfile.mkdtemp(prefix=f'chrome-profile-{getWorkerId()}-')
+    _profile_dirs.append(profile_dir)
+    return profile_dir
+
+
+def cleanupChromeProfileDirs():
+    """Supprimer les profils Chrome créés par ce processus."""
+    while _profile_dirs:
+        shutil.rmtree(_profile_dirs.pop(), ignore_errors=True)
+
+
+def _readLogRecords(path):
+    """
+    Lire un fichier de log et regrouper les lignes de continuation
+    (messages multi-lignes) avec la ligne horodatée qui les précède.
+    """
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                timestamp = datetime.strptime(line[:22], LOG_DATE_FORMAT)
+            except ValueError:
+                if records:
+                    records[-1][1].append(line)
+                continue
+            records.append((timestamp, [line]))
+    return records
+
+
+def mergeWorkerLogs(log_file):
+    """
+    Fusionner les logs des workers (automation.gw*.log) dans le log principal,
+    triés par horodatage, puis supprimer les fichiers des workers.
+
+    Args:
+        log_file: Chemin du log principal (ex: ./Logs/automation.log).
+
+    Returns:
+        int: Nombre de fichiers de workers fusionnés.
+    """
+    root, ext = os.path.splitext(log_file)
+    worker_files = sorted(glob.glob(f'{root}.gw*{ext or ".log"}'))
+    if not worker_files:
+        return 0
+
+    streams = [_readLogRecords(path) for path in worker_files]
+    with open(log_file, 'a', encoding='utf-8') as out:
+        for _, lines in heapq.merge(*streams, key=lambda record: record[0]):
+            out.writelines(lines)
+
+    for path in worker_files:
+        os.remove(path)
+    return len(worker_files)
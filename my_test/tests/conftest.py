@@ -1,11 +1,20 @@
 import pytest 
 from selenium import webdriver  
+from utilities import XLUtils
+# Plugin DDT : un cas de test par ligne des fichiers @pytest.mark.datafile(...)
+from utilities.ddtPlugin import pytest_configure, pytest_generate_tests, row
 @pytest.fixture()
 def setup():
     driver = webdriver.Chrome() 
     driver.current_url
     return driver 
  # Retourne l'instance de WebDriver pour utilisation dans les tests
+
+@pytest.fixture(autouse=True)
+def excel_writes():
+    # Les XLUtils.writeData() d'un test sont sauvegardés en une seule fois à la fin du test
+    yield
+    XLUtils.flush()
 """"
 Dans Pytest, une "fixture" est une fonction spéciale utilisée pour préparer l'état nécessaire pour les tests. 
 Les fixtures peuvent être utilisées pour configurer des objets ou des environnements, 
@@ -1,22 +1,93 @@
+import atexit
+import os
+
 import openpyxl
 
+# Cache des classeurs : chemin absolu -> {'mtime': ..., 'sheets': {nom: [lignes]}}
+# Chaque classeur est lu une seule fois (mode read_only, en flux) puis servi
+# depuis la mémoire tant que le fichier n'est pas modifié sur le disque.
+_workbooks = {}
+
+# Écritures en attente : chemin absolu -> {nom de feuille: {(ligne, colonne): valeur}}
+# Elles sont enregistrées en une seule sauvegarde par flush().
+_pending_writes = {}
+
+
+def _key(file):
+    return os.path.abspath(file)
+
+
+def _loadSheet(file, sheetName):
+    path = _key(file)
+    mtime = os.path.getmtime(path)
+    entry = _workbooks.get(path)
+    if entry is None or entry['mtime'] != mtime:
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        try:
+            sheets = {sheet.title: [list(row) for row in sheet.iter_rows(values_only=True)]
+                      for sheet in workbook.worksheets}
+        finally:
+            workbook.close()
+        entry = {'mtime': mtime, 'sheets': sheets}
+        _workbooks[path] = entry
+    return entry['sheets'][sheetName]
+
+
 def getRowCount(file,sheetName):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetName]
-    return(sheet.max_row)
+    return len(_loadSheet(file, sheetName))
 
 def getColumnCount(file,sheetName):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetName]
-    return(sheet.max_column)
+    return max((len(row) for row in _loadSheet(file, sheetName)), default=0)
+
+def getRows(file,sheetName,min_row=1):
+    """Renvoyer les lignes de la feuille (listes de valeurs) à partir de min_row."""
+    return _loadSheet(file, sheetName)[min_row - 1:]
+
+def readRow(file,sheetName,rownum):
+    """Renvoyer les valeurs d'une ligne (écritures en attente comprises)."""
+    rows = _loadSheet(file, sheetName)
+    values = list(rows[rownum - 1]) if rownum <= len(rows) else []
+    for (row, column), data in _pending_writes.get(_key(file), {}).get(sheetName, {}).items():
+        if row == rownum:
+            values.extend([None] * (column - len(values)))
+            values[column - 1] = data
+    return values
 
 def readData(file,sheetName,rownum,columnno):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetName]
-    return sheet.cell(row=rownum, column=columnno).value
+    pending = _pending_writes.get(_key(file), {}).get(sheetName, {})
+    if (rownum, columnno) in pending:
+        return pending[(rownum, columnno)]
+    rows = _loadSheet(file, sheetName)
+    if rownum > len(rows) or columnno > len(rows[rownum - 1]):
+        return None
+    return rows[rownum - 1][columnno - 1]
 
 def writeData(file,sheetName,rownum,columnno,data):
-    workbook = openpyxl.load_workbook(file)
-    sheet = workbook[sheetName]
-    sheet.cell(row=rownum, column=columnno).value = data
-    workbook.save(file)
\ No newline at end of file
+    # Mise en attente : le classeur est sauvegardé une seule fois par flush()
+    _pending_writes.setdefault(_key(file), {}).setdefault(sheetName, {})[(rownum, columnno)] = data
+
+def flush(file=None):
+    """
+    Enregistrer les écritures en attente (toutes, ou celles d'un seul fichier)
+    avec une seule sauvegarde par classeur.
+    """
+    paths = [_key(file)] if file else list(_pending_writes)
+    for path in paths:
+        sheets = _pending_writes.pop(path, None)
+        if not sheets:
+            continue
+        workbook = openpyxl.load_workbook(path)
+        for sheetName, cells in sheets.items():
+            sheet = workbook[sheetName]
+            for (rownum, columnno), data in cells.items():
+                sheet.cell(row=rownum, column=columnno).value = data
+        workbook.save(path)
+        _workbooks.pop(path, None)
+
+def clearCache():
+    """Oublier les classeurs en mémoire (ils seront relus au prochain accès)."""
+    _workbooks.clear()
+
+
+# Ne jamais perdre d'écritures si un test oublie d'appeler flush()
+atexit.register(flush)
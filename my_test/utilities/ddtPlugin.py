@@ -0,0 +1,184 @@
+"""
+Plugin pytest de tests pilotés par les données (DDT).
+
+Chaque ligne d'un fichier .xlsx, .csv ou .jsonl devient un cas de test
+paramétré distinct : une ligne en échec n'en masque plus d'autres, et les
+lignes peuvent être réparties entre workers (pytest -n N).
+
+    @pytest.mark.datafile("./TestData/LoginData.xlsx", sheet="Sheet1")
+    def test_login_ddt(self, setup, row):
+        row['username'], row['password'], row['exp']
+
+A la collecte, les fichiers sont lus en flux et chaque cas ne garde qu'une
+référence légère (numéro de ligne ou position dans le fichier). Les valeurs
+ne sont chargées qu'à l'exécution du test par la fixture `row`.
+"""
+import csv
+import json
+import os
+
+import openpyxl
+import pytest
+
+from utilities import XLUtils
+
+
+class DataRow(dict):
+    """Ligne de données : accès par nom de colonne (row['username']) ou par index (row[0])."""
+
+    def __init__(self, header, values):
+        values = list(values)
+        super().__init__(zip(header, values))
+        self.values_list = values
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self.values_list[key]
+        return super().__getitem__(key)
+
+
+class RowRef:
+    """Référence légère vers une ligne d'une source de données."""
+
+    __slots__ = ('source', 'position', 'number')
+
+    def __init__(self, source, position, number):
+        self.source = source      # DataSource partagée par toutes les lignes du fichier
+        self.position = position  # numéro de ligne (xlsx) ou position en octets (csv/jsonl)
+        self.number = number      # numéro de la ligne de données (1 = première)
+
+    def load(self):
+        return self.source.load(self.position)
+
+
+class _LineCursor:
+    """Itère sur les lignes d'un fichier en mémorisant la position déjà consommée."""
+
+    def __init__(self, f):
+        self.f = f
+        self.consumed = f.tell()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.f.readline()
+        if not line:
+            raise StopIteration
+        self.consumed = self.f.tell()
+        return line
+
+
+class DataSource:
+    """Source de données d'un fichier (xlsx, csv ou jsonl)."""
+
+    def __init__(self, path, sheet=None, header=True):
+        self.path = path
+        self.sheet = sheet
+        self.has_header = header
+        self.kind = os.path.splitext(path)[1].lower().lstrip('.')
+        if self.kind not in ('xlsx', 'csv', 'jsonl'):
+            raise ValueError(f'Format de donnees non supporte: {path}')
+        self.header = None
+
+    def iterRefs(self):
+        """Parcourir le fichier en flux et produire une RowRef par ligne de données."""
+        return getattr(self, f'_iter_{self.kind}')()
+
+    def load(self, position):
+        """Charger les valeurs d'une ligne à partir de sa référence."""
+        return getattr(self, f'_load_{self.kind}')(position)
+
+    def _row(self, values):
+        header = self.header or [f'col{i + 1}' for i in range(len(values))]
+        return DataRow(header, values)
+
+    # --- Excel ------------------------------------------------------------
+    def _iter_xlsx(self):
+        workbook = openpyxl.load_workbook(self.path, read_only=True)
+        try:
+            sheet = workbook[self.sheet] if self.sheet else workbook.worksheets[0]
+            self.sheet = sheet.title
+            number = 0
+            for rownum, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+                if rownum == 1 and self.has_header:
+                    self.header = [str(v) for v in values]
+                    continue
+                if all(v is None for v in values):
+                    continue
+                number += 1
+                yield RowRef(self, rownum, number)
+        finally:
+            workbook.close()
+
+    def _load_xlsx(self, rownum):
+        return self._row(XLUtils.readRow(self.path, self.sheet, rownum))
+
+    # --- CSV --------------------------------------------------------------
+    def _iter_csv(self):
+        with open(self.path, newline='', encoding='utf-8') as f:
+            cursor = _LineCursor(f)
+            reader = csv.reader(cursor)
+            number = 0
+            while True:
+                start = cursor.consumed
+                try:
+                    values = next(reader)
+                except StopIteration:
+                    return
+                if self.has_header and self.header is None:
+                    self.header = values
+                    continue
+                if not values:
+                    continue
+                number += 1
+                yield RowRef(self, start, number)
+
+    def _load_csv(self, offset):
+        with open(self.path, newline='', encoding='utf-8') as f:
+            f.seek(offset)
+            return self._row(next(csv.reader(_LineCursor(f))))
+
+    # --- JSON lines -------------------------------------------------------
+    def _iter_jsonl(self):
+        with open(self.path, 'rb') as f:
+            number = 0
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    return
+                if line.strip():
+                    number += 1
+                    yield RowRef(self, offset, number)
+
+    def _load_jsonl(self, offset):
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            record = json.loads(f.readline())
+        if isinstance(record, dict):
+            return DataRow(list(record), list(record.values()))
+        return self._row(record)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'datafile(path, sheet=None, header=True): un cas de test par ligne du fichier')
+
+
+def pytest_generate_tests(metafunc):
+    marker = metafunc.definition.get_closest_marker('datafile')
+    if marker is None or 'row' not in metafunc.fixturenames:
+        return
+    path = marker.args[0] if marker.args else marker.kwargs['path']
+    if not os.path.isabs(path):
+        path = os.path.join(str(metafunc.config.rootpath), path)
+    source = DataSource(path, sheet=marker.kwargs.get('sheet'), header=marker.kwargs.get('header', True))
+    refs = list(source.iterRefs())
+    metafunc.parametrize('row', refs, ids=[f'row{ref.number}' for ref in refs], indirect=True)
+
+
+@pytest.fixture
+def row(request):
+    """Valeurs de la ligne de données du cas de test courant (chargées à la demande)."""
+    return request.param.load()